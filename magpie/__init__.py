@@ -14,14 +14,18 @@ def includeme(config):
     from magpie.constants import get_constant
     from magpie.utils import get_logger
 
-    mod_dir = get_constant("MAGPIE_MODULE_DIR", config)
+    # resolve settings once for all following lookups instead of from the configurator each time
+    settings = config.get_settings()
+    mod_dir = get_constant("MAGPIE_MODULE_DIR", settings)
     logger = get_logger(__name__)
-    logger.info("Adding MAGPIE_MODULE_DIR='%s' to path.", mod_dir)
-    sys.path.insert(0, mod_dir)
+    # avoid growing the path with duplicates when the application gets configured multiple times
+    if mod_dir not in sys.path:
+        logger.info("Adding MAGPIE_MODULE_DIR='%s' to path.", mod_dir)
+        sys.path.insert(0, mod_dir)
 
     config.include("magpie.api")
     config.include("magpie.db")
-    if get_constant("MAGPIE_UI_ENABLED", config):
+    if get_constant("MAGPIE_UI_ENABLED", settings):
         config.include("magpie.ui")
     else:
         logger.warning("Magpie UI not enabled.")
@@ -1,11 +1,12 @@
 import copy
 import inspect
 import re
+import threading
 import warnings
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlparse
 
-import requests
-import six
 from pyramid.authentication import IAuthenticationPolicy
 from pyramid.httpexceptions import (
     HTTPBadRequest,
@@ -18,17 +19,12 @@ from pyramid.httpexceptions import (
 from pyramid.request import Request
 from pyramid.response import Response
 from pyramid_beaker import set_cache_regions_from_settings
-from requests.exceptions import HTTPError
-from six.moves.urllib.parse import parse_qsl, urlparse
 
 from magpie.__meta__ import __version__ as magpie_version
-from magpie.adapter.magpieowssecurity import MagpieOWSSecurity
-from magpie.adapter.magpieservice import MagpieServiceStore
 from magpie.api.exception import evaluate_call, raise_http, valid_http, verify_param
 from magpie.api.generic import get_request_info
 from magpie.api.schemas import SigninAPI
 from magpie.app import setup_magpie_configs
-from magpie.compat import LooseVersion
 from magpie.constants import get_constant
 from magpie.security import get_auth_config
 from magpie.utils import (
@@ -42,6 +38,7 @@ from magpie.utils import (
     import_target,
     is_json_body,
     normalize_field_pattern,
+    parse_version_numbers,
     setup_cache_settings,
     setup_pyramid_config,
     setup_session_config
@@ -55,6 +52,8 @@ from twitcher.__version__ import __version__ as twitcher_version  # noqa
 from twitcher.adapter.base import AdapterInterface  # noqa
 from twitcher.owsproxy import owsproxy_defaultconfig  # noqa
 
+_VERSIONS_DETAILS = " Current package versions are (Twitcher: {}, Magpie: {})".format(twitcher_version, magpie_version)
+
 try:
     from twitcher.owsproxy import send_request  # noqa  # Twitcher >= 0.8.0
 except ImportError:
@@ -62,47 +61,44 @@ except ImportError:
     from twitcher.owsproxy import _send_request as send_request  # noqa
 
     warnings.warn(
-        "Older version of Twitcher detected. Using old references as fallback for backward compatibility support."
-        "Consider updating to a more recent version of Twitcher."
-        "Current package versions are (Twitcher: {}, Magpie: {})".format(twitcher_version, magpie_version),
+        "Older version of Twitcher detected. Using old references as fallback for backward compatibility support. "
+        "Consider updating to a more recent version of Twitcher." + _VERSIONS_DETAILS,
         ImportWarning
     )
 
 
-if LooseVersion(twitcher_version) >= LooseVersion("0.6.0"):
-    from twitcher.owsregistry import OWSRegistry  # noqa  # pylint: disable=E0611  # Twitcher >= 0.6.x
+# parse version only once for all following compatibility checks
+TWITCHER_VERSION = parse_version_numbers(twitcher_version)
 
-    if LooseVersion(twitcher_version) >= LooseVersion("0.9.0"):
-        warnings.warn(
-            "This Magpie version is not guaranteed to work with newer versions of Twitcher. "
-            "This Magpie version offers compatibility with Twitcher 0.6.x through 0.8.x."
-            "Current package versions are (Twitcher: {}, Magpie: {})".format(twitcher_version, magpie_version),
-            ImportWarning
-        )
-    elif LooseVersion(twitcher_version) < LooseVersion("0.7.0"):
-        warnings.warn(
-            "This Magpie version offers more capabilities than Twitcher 0.6.x is able to provide. "
-            "Consider updating to more recent Twitcher 0.7.x to make use of new functionalities. "
-            "Current package versions are (Twitcher: {}, Magpie: {})".format(twitcher_version, magpie_version),
-            ImportWarning
-        )
+if TWITCHER_VERSION >= (0, 6, 0):
+    from twitcher.owsregistry import OWSRegistry  # noqa  # pylint: disable=E0611  # Twitcher >= 0.6.x
 
-if LooseVersion(twitcher_version) < LooseVersion("0.6.0"):
-    warnings.warn(
-        "This Magpie version is not guaranteed to work with versions prior to Twitcher 0.6.x. "
-        "It is recommended to either use more recent Twitcher 0.6.x version or revert back "
-        "to older Magpie < 3.18 in order to use Twitcher 0.5.x versions. "
-        "Current package versions are (Twitcher: {}, Magpie: {})".format(twitcher_version, magpie_version),
-        ImportWarning
+# version ranges are mutually exclusive, at most one warning is emitted
+_VERSIONS_WARNING = None
+if TWITCHER_VERSION >= (0, 9, 0):
+    _VERSIONS_WARNING = (
+        "This Magpie version is not guaranteed to work with newer versions of Twitcher. "
+        "This Magpie version offers compatibility with Twitcher 0.6.x through 0.8.x."
     )
-if LooseVersion(twitcher_version) == LooseVersion("0.6.0"):
-    warnings.warn(
+elif TWITCHER_VERSION == (0, 6, 0):
+    _VERSIONS_WARNING = (
         "Twitcher 0.6.0 exact version does not have complete compatibility support for MagpieAdapter. "
         "It is recommended to either revert to Twitcher 0.5.x and previous Magpie < 3.18 version, "
-        "or use a higher Twitcher 0.6.x version. "
-        "Current package versions are (Twitcher: {}, Magpie: {})".format(twitcher_version, magpie_version),
-        ImportWarning
+        "or use a higher Twitcher 0.6.x version."
+    )
+elif TWITCHER_VERSION < (0, 6, 0):
+    _VERSIONS_WARNING = (
+        "This Magpie version is not guaranteed to work with versions prior to Twitcher 0.6.x. "
+        "It is recommended to either use more recent Twitcher 0.6.x version or revert back "
+        "to older Magpie < 3.18 in order to use Twitcher 0.5.x versions."
     )
+elif TWITCHER_VERSION < (0, 7, 0):
+    _VERSIONS_WARNING = (
+        "This Magpie version offers more capabilities than Twitcher 0.6.x is able to provide. "
+        "Consider updating to more recent Twitcher 0.7.x to make use of new functionalities."
+    )
+if _VERSIONS_WARNING:
+    warnings.warn(_VERSIONS_WARNING + _VERSIONS_DETAILS, ImportWarning)
 
 if TYPE_CHECKING:
     from typing import Optional, Union
@@ -110,6 +106,11 @@ if TYPE_CHECKING:
     from pyramid.authentication import AuthTktCookieHelper
     from pyramid.config import Configurator
 
+    import requests
+    from requests.exceptions import HTTPError
+
+    from magpie.adapter.magpieowssecurity import MagpieOWSSecurity
+    from magpie.adapter.magpieservice import MagpieServiceStore
     from magpie.models import Resource
     from magpie.services import ServiceInterface as MagpieService
     from magpie.typedefs import (
@@ -127,6 +128,40 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger("TWITCHER|{}".format(__name__))
 
+_VERIFY_SESSION = None  # type: Optional[requests.Session]
+_VERIFY_SESSION_LOCK = threading.Lock()
+_VERIFY_SESSION_POOL_CONNECTIONS = 16
+_VERIFY_SESSION_POOL_MAXSIZE = 64
+
+
+def get_verify_session():
+    # type: () -> requests.Session
+    """
+    Obtain the :class:`requests.Session` reused by :func:`verify_user` to communicate with the ``Magpie`` instance.
+
+    The session (and the :mod:`requests` module itself) is only created on first use to avoid its import and setup
+    costs in processes that never call the verification endpoint. Reusing the session allows connection pooling
+    (keep-alive) to avoid establishing a new TCP/TLS connection with the ``Magpie`` instance for every verification.
+
+    Since the session is shared by all users (and threads) verified by the adapter, its cookie jar rejects any cookie.
+    Otherwise, authentication cookies returned by one user sign-in would be sent along the sign-in of following users.
+    Cookies returned by each sign-in remain available from the corresponding response.
+    """
+    global _VERIFY_SESSION  # pylint: disable=W0603,global-statement
+    if _VERIFY_SESSION is None:
+        with _VERIFY_SESSION_LOCK:
+            if _VERIFY_SESSION is None:
+                import requests  # noqa: F811  # pylint: disable=C0415,W0621  # defer heavy import until needed
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=_VERIFY_SESSION_POOL_CONNECTIONS,
+                                                        pool_maxsize=_VERIFY_SESSION_POOL_MAXSIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"Accept": CONTENT_TYPE_JSON})
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                _VERIFY_SESSION = session
+    return _VERIFY_SESSION
+
 
 def verify_user(request):
     # type: (Request) -> HTTPException
@@ -137,16 +172,26 @@ def verify_user(request):
     :param request: an HTTP request with valid authentication token/cookie credentials.
     :return: appropriate HTTP success or error response with details about the result.
     """
-    magpie_url = get_magpie_url(request)
+    from requests.exceptions import HTTPError  # noqa: F811  # pylint: disable=C0415,W0621  # defer heavy import
+
+    # resolved URLs do not change between requests, cache them in the application registry
+    registry = request.registry
+    urls = registry.get("magpie.adapter.verify_urls")
+    if urls is None:
+        magpie_url = get_magpie_url(request)
+        urls = registry["magpie.adapter.verify_urls"] = (magpie_url, magpie_url + SigninAPI.path)
+    magpie_url, signin_url = urls
+    session = get_verify_session()
 
     def try_login():
         # type: () -> Union[AnyResponseType, HTTPError]
         try:
             params = dict(parse_qsl(urlparse(request.url).query))
             if is_json_body(request.text) and not params:
-                return requests.post(magpie_url + SigninAPI.path, json=request.json,
-                                     headers={"Content-Type": CONTENT_TYPE_JSON, "Accept": CONTENT_TYPE_JSON})
-            return requests.get(magpie_url + SigninAPI.path, data=request.text, params=params)
+                # forward the raw JSON body directly to avoid parsing and serializing it again
+                # 'Accept' is already defined by the session
+                return session.post(signin_url, data=request.body, headers={"Content-Type": CONTENT_TYPE_JSON})
+            return session.get(signin_url, data=request.text, params=params)
         except HTTPError as exc:
             if getattr(exc, "status_code", 500) >= 500:
                 raise
@@ -199,19 +244,21 @@ def verify_user(request):
     return valid_http(HTTPOk, detail="Twitcher login verified successfully with Magpie login.")
 
 
-@six.add_metaclass(SingletonMeta)
-class MagpieAdapter(AdapterInterface):
+class MagpieAdapter(AdapterInterface, metaclass=SingletonMeta):
     # pylint: disable: W0223,W0612
+    # 'settings' is assigned by 'AdapterInterface', but defining it as slot avoids instance dictionary lookups
+    # when it is accessed on each request (e.g.: when applying service hooks)
+    __slots__ = ("_owssecurity", "settings")
+
+    servicestore_registry_key = "magpie.adapter.servicestore"
 
     def __init__(self, container):
         # type: (AnySettingsContainer) -> None
-        self._servicestore = None
         self._owssecurity = None
-        super(MagpieAdapter, self).__init__(container)  # pylint: disable=E1101,no-member
+        super().__init__(container)  # pylint: disable=E1101,no-member
 
     def reset(self):
         # type: () -> None
-        self._servicestore = None
         self._owssecurity = None
 
     @property
@@ -226,9 +273,24 @@ class MagpieAdapter(AdapterInterface):
 
     def servicestore_factory(self, request):
         # type: (Request) -> MagpieServiceStore
-        if self._servicestore is None:
-            self._servicestore = MagpieServiceStore(request)
-        return self._servicestore
+        """
+        Obtains the :class:`MagpieServiceStore` bound to the specified request.
+
+        Settings, URLs and administrator credentials resolved by the store are computed only once and cached in the
+        application registry of the request, such that distinct applications (e.g.: in tests) do not share them.
+        Each call returns a shallow copy of that cached store bound to the current request to avoid reusing the
+        headers and database session of the request that created it.
+        """
+        registry = request.registry
+        store = registry.get(self.servicestore_registry_key)
+        if store is None:
+            # pylint: disable=C0415,W0621  # defer import of store and its dependencies until actually needed
+            from magpie.adapter.magpieservice import MagpieServiceStore  # noqa: F811
+            store = registry[self.servicestore_registry_key] = MagpieServiceStore(request)
+        if store.request is not request:
+            store = copy.copy(store)
+            store.request = request
+        return store
 
     def tokenstore_factory(self, request):
         # type: (Request) -> AccessTokenStoreInterface
@@ -259,6 +321,8 @@ class MagpieAdapter(AdapterInterface):
             Method :paramref:`request` does not exist starting in ``Twitcher >= 0.6.x``.
         """
         if self._owssecurity is None:
+            # pylint: disable=C0415,W0621  # defer import of security handler and its dependencies until needed
+            from magpie.adapter.magpieowssecurity import MagpieOWSSecurity  # noqa: F811
             self._owssecurity = MagpieOWSSecurity(request or self.settings)
         return self._owssecurity
 
@@ -15,13 +15,19 @@ from six.moves.urllib.parse import urlparse
 
 from magpie.api.exception import evaluate_call, verify_param
 from magpie.api.schemas import ProviderSigninAPI
-from magpie.compat import LooseVersion
 from magpie.constants import get_constant
 from magpie.db import get_connected_session
 from magpie.models import Service
 from magpie.permissions import Permission
 from magpie.services import invalidate_service, service_factory
-from magpie.utils import CONTENT_TYPE_JSON, get_authenticate_headers, get_logger, get_magpie_url, get_settings
+from magpie.utils import (
+    CONTENT_TYPE_JSON,
+    get_authenticate_headers,
+    get_logger,
+    get_magpie_url,
+    get_settings,
+    parse_version_numbers
+)
 
 # WARNING:
 #   Twitcher available only when this module is imported from it.
@@ -34,7 +40,9 @@ from twitcher.owsexceptions import OWSInvalidParameterValue  # noqa
 from twitcher.owsexceptions import OWSMissingParameterValue  # noqa
 from twitcher.utils import parse_service_name  # noqa
 
-if LooseVersion(twitcher_version) >= LooseVersion("0.6.0"):
+TWITCHER_VERSION = parse_version_numbers(twitcher_version)
+
+if TWITCHER_VERSION >= (0, 6, 0):
     from twitcher.interface import OWSSecurityInterface  # noqa  # pylint: disable=E0611  # Twitcher >= 0.6.x
 else:
     from twitcher.owssecurity import OWSSecurityInterface  # noqa
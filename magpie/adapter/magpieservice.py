@@ -9,7 +9,6 @@ from pyramid.httpexceptions import HTTPOk
 from pyramid.settings import asbool
 
 from magpie.api.schemas import ServicesAPI
-from magpie.compat import LooseVersion
 from magpie.db import get_connected_session
 from magpie.models import Service as MagpieService
 from magpie.services import invalidate_service
@@ -19,7 +18,8 @@ from magpie.utils import (
     get_logger,
     get_magpie_url,
     get_settings,
-    get_twitcher_url
+    get_twitcher_url,
+    parse_version_numbers
 )
 
 # WARNING:
@@ -29,10 +29,12 @@ from magpie.utils import (
 from twitcher.__version__ import __version__ as twitcher_version  # noqa
 from twitcher.exceptions import ServiceNotFound  # noqa
 
-if LooseVersion(twitcher_version) > LooseVersion("0.6.0"):
+TWITCHER_VERSION = parse_version_numbers(twitcher_version)
+
+if TWITCHER_VERSION > (0, 6, 0):
     from twitcher.models import Service as TwitcherService  # noqa  # pylint: disable=E0611  # Twitcher >= 0.6.0
     from twitcher.store import ServiceStoreInterface  # noqa  # pylint: disable=E0611  # Twitcher > 0.6.0
-elif LooseVersion(twitcher_version) == LooseVersion("0.6.0"):
+elif TWITCHER_VERSION == (0, 6, 0):
     from twitcher.models import Service as TwitcherService  # noqa  # pylint: disable=E0611  # Twitcher >= 0.6.0
 
     class ServiceStoreInterface(object):  # was removed on initial 0.6.0 version
@@ -153,7 +155,7 @@ class MagpieServiceStore(ServiceStoreInterface):
             type=service.type,
             verify=self.twitcher_ssl_verify
         )
-        if LooseVersion(twitcher_version) >= LooseVersion("0.6.0"):
+        if TWITCHER_VERSION >= (0, 6, 0):
             service_data["_verify"] = int(service_data.pop("verify"))  # parameter renamed and different type
             service_data["id"] = service.resource_id
             service_data["purl"] = "{}/{}".format(self.twitcher_url, service.resource_name)
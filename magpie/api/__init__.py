@@ -1,3 +1,6 @@
+from pyramid.renderers import JSON
+
+from magpie.api.exception import json_dumps
 from magpie.utils import get_logger
 
 LOGGER = get_logger(__name__)
@@ -6,6 +9,9 @@ LOGGER = get_logger(__name__)
 def includeme(config):
     LOGGER.info("Adding API routes...")
 
+    # render JSON views (e.g.: API schema) with the same serializer as generated API responses
+    config.add_renderer("json", JSON(serializer=json_dumps))
+
     # Add all the admin ui routes
     config.include("magpie.api.home")
     config.include("magpie.api.login")
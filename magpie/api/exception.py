@@ -1,11 +1,13 @@
 import json
+import operator
 import platform
 import re
+import threading
+from itertools import compress
 from sys import exc_info
 from typing import TYPE_CHECKING
 
 import colander
-import six
 from dicttoxml import dicttoxml
 from pyramid.httpexceptions import (
     HTTPBadRequest,
@@ -33,16 +35,26 @@ from magpie.utils import (
 
 if TYPE_CHECKING:
     # pylint: disable=W0611,unused-import
-    from typing import Any, Callable, Iterable, List, NoReturn, Optional, Tuple, Type, Union
+    from typing import Any, Callable, Dict, Iterable, List, NoReturn, Optional, Tuple, Type, Union
 
     from magpie.typedefs import JSON, ParamsType, Str
 
+try:
+    import orjson  # optional, faster serialization of response contents
+
+    def json_dumps(content, default=None):
+        # type: (JSON, Optional[Callable[[Any], JSON]]) -> Str
+        return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:  # pragma: no cover
+    json_dumps = json.dumps
+
 LOGGER = get_logger(__name__)
 
 # control variables to avoid infinite recursion in case of
 # major programming error to avoid application hanging
+# count is tracked per thread to avoid interference between concurrently processed requests
 RAISE_RECURSIVE_SAFEGUARD_MAX = 5
-RAISE_RECURSIVE_SAFEGUARD_COUNT = 0
+RAISE_RECURSIVE_SAFEGUARD_STATE = threading.local()
 
 # utility parameter validation regexes for 'matches' argument
 PARAM_REGEX = re.compile(r"^[A-Za-z0-9]+(?:[\s_\-\.][A-Za-z0-9]+)*$")    # request parameters
@@ -52,12 +64,75 @@ UUID_REGEX = re.compile(colander.UUID_REGEX)
 URL_REGEX = re.compile(colander.URL_REGEX, re.I | re.X)
 INDEX_REGEX = re.compile(r"^[0-9]+$")
 
+# common collections provided as 'param_compare' to 'verify_param', checked first to avoid slower attribute lookup
+_COMPARE_COLLECTION_TYPES = (list, tuple, set, frozenset, dict)
+
+# hashed lookup of supported content types validated for every generated response
+_SUPPORTED_ACCEPT_TYPES_SET = frozenset(SUPPORTED_ACCEPT_TYPES)
+
+# HTTP codes of combinations of HTTP class, base requirements and content type already validated by 'validate_params'
+# only successful validations are stored, which limits entries to the HTTP classes and content types employed in code
+_VALIDATED_HTTP_PARAMS = {}  # type: Dict[Tuple[Type[HTTPException], Tuple[Type[HTTPException], ...], Str], int]
+
+# HTML response body sections surrounding the preformatted details, inserted after the HTTP class explanation
+_HTML_DETAILS_START = "<br><h2>{} Details</h2><pre style='word-wrap: break-word; white-space: pre-wrap;'>"
+_HTML_EXCEPTION_DETAILS = _HTML_DETAILS_START.format("Exception")
+_HTML_RESPONSE_DETAILS = _HTML_DETAILS_START.format("Response")
+_HTML_DETAILS_END = "</pre>"
+
 if platform.python_version() >= "3.7":
     Pattern = re.Pattern
 else:
     Pattern = type(re.compile(""))
 
 
+def _verify_matches(param, param_compare):
+    # type: (Any, Union[Str, Pattern]) -> bool
+    if isinstance(param_compare, str):
+        param_compare = re.compile(param_compare, re.I | re.X)
+    return bool(param_compare.match(param))
+
+
+# predicates of each 'verify_param' flag, resolved once, in the order they are reported on failure
+# each one receives '(param, param_compare)' and returns 'True' when the verification is satisfied
+# flags provided to 'verify_param' are packed positionally in this same order to select the requested predicates
+_VERIFY_PARAM_CHECKS = (
+    ("not_none", lambda param, _: param is not None),
+    ("is_none", lambda param, _: param is None),
+    ("is_true", lambda param, _: param is True),
+    ("is_false", lambda param, _: param is False),
+    ("not_empty", lambda param, _: hasattr(param, "__len__") and len(param) > 0),
+    ("is_empty", lambda param, _: hasattr(param, "__len__") and len(param) == 0),
+    ("not_in", lambda param, compare: param not in compare),
+    ("is_in", lambda param, compare: param in compare),
+    ("not_equal", operator.ne),
+    ("is_equal", operator.eq),
+    ("is_type", isinstance),
+    ("matches", _verify_matches),
+)  # type: Tuple[Tuple[Str, Callable[[Any, Any], bool]], ...]
+
+# predicates selected from '_VERIFY_PARAM_CHECKS' for each combination of flags already requested to 'verify_param'
+# entries are limited to the few combinations employed in code, avoiding to filter the whole table on every call
+_VERIFY_PARAM_SELECTED_CHECKS = {}  # type: Dict[Tuple[bool, ...], Tuple[Tuple[Str, Callable[[Any, Any], bool]], ...]]
+
+
+def _resolve_content(content):
+    # type: (Optional[Union[JSON, Callable[[], JSON]]]) -> JSON
+    """
+    Obtains the additional error content, calling the provided function if it must be generated on demand.
+    """
+    if callable(content):
+        content = content()
+    return {} if content is None else content
+
+
+def _repr_content(content):
+    # type: (Optional[Union[JSON, Callable[[], JSON]]]) -> Optional[Str]
+    if callable(content):
+        content = content()
+    return repr(content) if content is not None else content
+
+
 def verify_param(  # noqa: E126  # pylint: disable=R0913,too-many-arguments
                  # --- verification values ---      # noqa: E126
                  param,                             # type: Any
@@ -69,7 +144,7 @@ def verify_param(  # noqa: E126  # pylint: disable=R0913,too-many-arguments
                  http_error=HTTPBadRequest,         # type: Type[HTTPError]
                  http_kwargs=None,                  # type: Optional[ParamsType]
                  msg_on_fail="",                    # type: Str
-                 content=None,                      # type: Optional[JSON]
+                 content=None,                      # type: Optional[Union[JSON, Callable[[], JSON]]]
                  content_type=CONTENT_TYPE_JSON,    # type: Str
                  metadata=None,                     # type: Optional[JSON]
                  # --- verification flags (method) ---
@@ -107,7 +182,9 @@ def verify_param(  # noqa: E126  # pylint: disable=R0913,too-many-arguments
     :param http_error: derived exception to raise on test failure (default: :class:`HTTPBadRequest`)
     :param http_kwargs: additional keyword arguments to pass to :paramref:`http_error` called in case of HTTP exception
     :param msg_on_fail: message details to return in HTTP exception if flag condition failed
-    :param content: json formatted additional content to provide in case of exception
+    :param content:
+        JSON formatted additional content to provide in case of exception.
+        Can be a function without arguments returning the content, called only when it is needed for the exception.
     :param content_type: format in which to return the exception
         (one of :py:data:`magpie.common.SUPPORTED_ACCEPT_TYPES`)
     :param metadata: request metadata to add to the response body. (see: :func:`magpie.api.requests.get_request_info`)
@@ -127,7 +204,8 @@ def verify_param(  # noqa: E126  # pylint: disable=R0913,too-many-arguments
     :raises HTTPInternalServerError: for evaluation error
     :return: nothing if all tests passed
     """
-    content = {} if content is None else content
+    flags = (not_none, is_none, is_true, is_false, not_empty, is_empty,
+             not_in, is_in, not_equal, is_equal, is_type, matches)  # same order as '_VERIFY_PARAM_CHECKS'
     needs_compare = is_type or is_in or not_in or is_equal or not_equal or matches
     needs_iterable = is_in or not_in
 
@@ -135,54 +213,43 @@ def verify_param(  # noqa: E126  # pylint: disable=R0913,too-many-arguments
     try:
         # following TypeError/ValueError are used instead of HTTPError as they would be incorrect setup by the developer
         # after validation of their conditions, we do actual validation of the parameters according to conditions
-        if not isinstance(not_none, bool):
-            raise TypeError("'not_none' is not a 'bool'")
-        if not isinstance(not_empty, bool):
-            raise TypeError("'not_empty' is not a 'bool'")
-        if not isinstance(not_in, bool):
-            raise TypeError("'not_in' is not a 'bool'")
-        if not isinstance(not_equal, bool):
-            raise TypeError("'not_equal' is not a 'bool'")
-        if not isinstance(is_true, bool):
-            raise TypeError("'is_true' is not a 'bool'")
-        if not isinstance(is_false, bool):
-            raise TypeError("'is_false' is not a 'bool'")
-        if not isinstance(is_none, bool):
-            raise TypeError("'is_none' is not a 'bool'")
-        if not isinstance(is_empty, bool):
-            raise TypeError("'is_empty' is not a 'bool'")
-        if not isinstance(is_in, bool):
-            raise TypeError("'is_in' is not a 'bool'")
-        if not isinstance(is_equal, bool):
-            raise TypeError("'is_equal' is not a 'bool'")
-        if not isinstance(is_type, bool):
-            raise TypeError("'is_type' is not a 'bool'")
-        if not isinstance(matches, bool):
-            raise TypeError("'matches' is not a 'bool'")
-        # error if none of the flags specified
-        if not any([not_none, not_empty, not_in, not_equal,
-                    is_none, is_empty, is_in, is_equal, is_true, is_false, is_type, matches]):
-            raise ValueError("no comparison flag specified for verification")
+        if not (
+            isinstance(not_none, bool) and isinstance(is_none, bool) and isinstance(is_true, bool) and
+            isinstance(is_false, bool) and isinstance(not_empty, bool) and isinstance(is_empty, bool) and
+            isinstance(not_in, bool) and isinstance(is_in, bool) and isinstance(not_equal, bool) and
+            isinstance(is_equal, bool) and isinstance(is_type, bool) and isinstance(matches, bool)
+        ):
+            # find the offending flag only when invalid
+            for (flag, _), value in zip(_VERIFY_PARAM_CHECKS, flags):
+                if not isinstance(value, bool):
+                    raise TypeError("'{}' is not a 'bool'".format(flag))
+        # error if none of the flags specified, otherwise keep only the predicates of requested flags
+        checks = _VERIFY_PARAM_SELECTED_CHECKS.get(flags)
+        if checks is None:
+            checks = tuple(compress(_VERIFY_PARAM_CHECKS, flags))
+            if not checks:
+                raise ValueError("no comparison flag specified for verification")
+            _VERIFY_PARAM_SELECTED_CHECKS[flags] = checks
         if param_compare is None and needs_compare:
             raise TypeError("'param_compare' cannot be 'None' with specified test flags")
         is_cmp_typ = isinstance(param_compare, type) or (
             isinstance(param_compare, tuple) and param_compare and all(isinstance(_cmp, type) for _cmp in param_compare)
         )
         if is_cmp_typ:  # avoid calling 'in' or '__eq__' implementation that could have trouble with 'other' as str type
-            is_str_typ = param_compare in six.string_types or param_compare == six.string_types
+            is_str_typ = param_compare is str or param_compare == (str, )
         else:
             is_str_typ = False
         if needs_compare and not needs_iterable:
             # allow 'different' string literals for comparison, otherwise types between value/compare must match exactly
             # with 'is_type', comparison must be made directly with compare as type instead of with instance type
-            is_str_cmp = isinstance(param, six.string_types)
-            ok_str_cmp = isinstance(param_compare, six.string_types)
+            is_str_cmp = isinstance(param, str)
+            ok_str_cmp = isinstance(param_compare, str)
             eq_typ_cmp = type(param) is type(param_compare)
             is_pattern = matches and isinstance(param_compare, Pattern)
             if is_type and not (is_str_typ or is_cmp_typ):
                 LOGGER.debug("[param: %s] invalid type compare with [param_compare: %s]", type(param), param_compare)
                 raise TypeError("'param_compare' cannot be of non-type with specified verification flags")
-            if matches and not isinstance(param_compare, (six.string_types, Pattern)):
+            if matches and not isinstance(param_compare, (str, Pattern)):
                 LOGGER.debug("[param_compare: %s] invalid type is not a regex string or pattern", type(param_compare))
                 raise TypeError("'param_compare' for matching verification must be a string or compile regex pattern")
             if not is_type and not ((is_str_cmp and ok_str_cmp) or (not is_str_cmp and eq_typ_cmp) or is_pattern):
@@ -194,67 +261,37 @@ def verify_param(  # noqa: E126  # pylint: disable=R0913,too-many-arguments
                 # when both 'param' and 'param_compare' are values, then the types must match
                 # raise immediately since mismatching param types can make following checks fail uncontrollably
                 LOGGER.debug("[param: %s] != [param_compare: %s]", type(param), type(param_compare))
-                content = apply_param_content(content, param, param_compare, param_name, with_param, param_content,
-                                              needs_compare, needs_iterable, is_type, {"is_type": False})
+                content = apply_param_content(_resolve_content(content), param, param_compare, param_name,
+                                              with_param, param_content, needs_compare, needs_iterable, is_type,
+                                              {"is_type": False})
                 raise_http(http_error, http_kwargs=http_kwargs, detail=msg_on_fail,
                            content=content, content_type=content_type, metadata=metadata)
-        if needs_iterable and (not hasattr(param_compare, "__iter__") or is_str_typ or is_cmp_typ):
+        if needs_iterable and (is_str_typ or is_cmp_typ or not (
+            isinstance(param_compare, _COMPARE_COLLECTION_TYPES) or hasattr(param_compare, "__iter__")
+        )):
             LOGGER.debug("[param_compare: %s]", param_compare)
             raise TypeError("'param_compare' must be an iterable of values for specified verification flags")
     except HTTPException:
         raise
     except Exception as exc:
+        content = _resolve_content(content)
         content["traceback"] = repr(exc_info())
         content["exception"] = repr(exc)
-        raise_http(http_error=HTTPInternalServerError, http_kwargs=http_kwargs,
-                   content=content, content_type=content_type, metadata=metadata,
-                   detail="Error occurred during parameter verification")
+        _raise_http_internal(http_kwargs=http_kwargs, content=content, content_type=content_type, metadata=metadata,
+                             detail="Error occurred during parameter verification")
 
     # passed this point, input condition flags are valid, evaluate requested parameter combinations
     fail_conditions = {}
     fail_verify = False
-    if not_none:
-        fail_conditions.update({"not_none": param is not None})
-        fail_verify = fail_verify or not fail_conditions["not_none"]
-    if is_none:
-        fail_conditions.update({"is_none": param is None})
-        fail_verify = fail_verify or not fail_conditions["is_none"]
-    if is_true:
-        fail_conditions.update({"is_true": param is True})
-        fail_verify = fail_verify or not fail_conditions["is_true"]
-    if is_false:
-        fail_conditions.update({"is_false": param is False})
-        fail_verify = fail_verify or not fail_conditions["is_false"]
-    if not_empty:
-        fail_conditions.update({"not_empty": hasattr(param, "__len__") and len(param) > 0})
-        fail_verify = fail_verify or not fail_conditions["not_empty"]
-    if is_empty:
-        fail_conditions.update({"is_empty": hasattr(param, "__len__") and len(param) == 0})
-        fail_verify = fail_verify or not fail_conditions["is_empty"]
-    if not_in:
-        fail_conditions.update({"not_in": param not in param_compare})
-        fail_verify = fail_verify or not fail_conditions["not_in"]
-    if is_in:
-        fail_conditions.update({"is_in": param in param_compare})
-        fail_verify = fail_verify or not fail_conditions["is_in"]
-    if not_equal:
-        fail_conditions.update({"not_equal": param != param_compare})
-        fail_verify = fail_verify or not fail_conditions["not_equal"]
-    if is_equal:
-        fail_conditions.update({"is_equal": param == param_compare})
-        fail_verify = fail_verify or not fail_conditions["is_equal"]
-    if is_type:
-        fail_conditions.update({"is_type": isinstance(param, param_compare)})
-        fail_verify = fail_verify or not fail_conditions["is_type"]
-    if matches:
-        param_compare_regex = param_compare
-        if isinstance(param_compare, six.string_types):
-            param_compare_regex = re.compile(param_compare, re.I | re.X)
-        fail_conditions.update({"matches": bool(re.match(param_compare_regex, param))})
-        fail_verify = fail_verify or not fail_conditions["matches"]
+    for flag, check in checks:
+        if not check(param, param_compare):
+            fail_verify = True
+            fail_conditions[flag] = False
+        else:
+            fail_conditions[flag] = True
     if fail_verify:
-        content = apply_param_content(content, param, param_compare, param_name, with_param, param_content,
-                                      needs_compare, needs_iterable, is_type, fail_conditions)
+        content = apply_param_content(_resolve_content(content), param, param_compare, param_name, with_param,
+                                      param_content, needs_compare, needs_iterable, is_type, fail_conditions)
         raise_http(http_error, http_kwargs=http_kwargs, detail=msg_on_fail,
                    content=content, content_type=content_type, metadata=metadata)
 
@@ -279,7 +316,7 @@ def apply_param_content(content,                # type: JSON
     if with_param:
         content["param"] = {}
         content["param"]["conditions"] = fail_conditions
-        if isinstance(param, six.string_types + (int, float, bool, type(None))):  # type: ignore
+        if isinstance(param, (str, int, float, bool, type(None))):
             content["param"]["value"] = param
         else:
             content["param"]["value"] = str(param)
@@ -287,7 +324,7 @@ def apply_param_content(content,                # type: JSON
             content["param"]["name"] = str(param_name)
         if needs_compare and param_compare is not None:
             if needs_iterable or is_type:
-                param_compare = str if param_compare == six.string_types else param_compare
+                param_compare = str if param_compare == (str, ) else param_compare
                 param_compare = getattr(param_compare, "__name__", str(param_compare))
                 param_compare = "Type[{}]".format(param_compare) if is_type else param_compare
             if isinstance(param_compare, Pattern):
@@ -303,7 +340,7 @@ def evaluate_call(call,                                 # type: Callable[[], Any
                   http_error=HTTPInternalServerError,   # type: Type[HTTPError]
                   http_kwargs=None,                     # type: Optional[ParamsType]
                   msg_on_fail="",                       # type: Str
-                  content=None,                         # type: Optional[JSON]
+                  content=None,                         # type: Optional[Union[JSON, Callable[[], JSON]]]
                   content_type=CONTENT_TYPE_JSON,       # type: Str
                   metadata=None,                        # type: Optional[JSON]
                   ):                                    # type: (...) -> Any
@@ -336,31 +373,34 @@ def evaluate_call(call,                                 # type: Callable[[], Any
     :param http_error: alternative exception to raise on `call` failure
     :param http_kwargs: additional keyword arguments to pass to `http_error` if called in case of HTTP exception
     :param msg_on_fail: message details to return in HTTP exception if `call` failed
-    :param content: json formatted additional content to provide in case of exception
+    :param content:
+        json formatted additional content to provide in case of exception,
+        or function without arguments returning it, called only when needed for the exception
     :param content_type: format in which to return the exception (one of `magpie.common.SUPPORTED_ACCEPT_TYPES`)
     :param metadata: request metadata to add to the response body. (see: :func:`magpie.api.requests.get_request_info`)
     :raises http_error: on `call` failure
     :raises `HTTPInternalServerError`: on `fallback` failure
     :return: whichever return value `call` might have if no exception occurred
     """
-    msg_on_fail = str(msg_on_fail) if isinstance(msg_on_fail, six.string_types) else repr(msg_on_fail)
-    content_repr = repr(content) if content is not None else content
+    msg_on_fail = msg_on_fail if isinstance(msg_on_fail, str) else repr(msg_on_fail)
     if not islambda(call):
         raise_http(http_error=HTTPInternalServerError, http_kwargs=http_kwargs, metadata=metadata,
                    detail="Input 'call' is not a lambda expression.",
-                   content={"call": {"detail": msg_on_fail, "content": content_repr}}, content_type=content_type)
+                   content={"call": {"detail": msg_on_fail, "content": _repr_content(content)}},
+                   content_type=content_type)
 
     # preemptively check fallback to avoid possible call exception without valid recovery
     if fallback is not None:
         if not islambda(fallback):
             raise_http(http_error=HTTPInternalServerError, http_kwargs=http_kwargs, metadata=metadata,
                        detail="Input 'fallback'  is not a lambda expression, not attempting 'call'.",
-                       content={"call": {"detail": msg_on_fail, "content": content_repr}}, content_type=content_type)
+                       content={"call": {"detail": msg_on_fail, "content": _repr_content(content)}},
+                       content_type=content_type)
     try:
         return call()
     except Exception as exc:
         exc_call = {"exception": type(exc).__name__, "error": str(exc),
-                    "detail": msg_on_fail, "content": content_repr, "type": content_type}
+                    "detail": msg_on_fail, "content": _repr_content(content), "type": content_type}
         LOGGER.debug("Exception during call evaluation: %s", exc_call, exc_info=exc)
     try:
         if fallback is not None:
@@ -393,17 +433,15 @@ def valid_http(http_success=HTTPOk,             # type: Union[Type[HTTPSuccessfu
     :param metadata: request metadata to add to the response body. (see: :func:`magpie.api.requests.get_request_info`)
     :returns: formatted successful response with additional details and HTTP code
     """
-    global RAISE_RECURSIVE_SAFEGUARD_COUNT  # pylint: disable=W0603
-
     content = {} if content is None else content
-    detail = repr(detail) if not isinstance(detail, six.string_types) else detail
+    detail = detail if isinstance(detail, str) else repr(detail)
     content_type = CONTENT_TYPE_JSON if content_type == CONTENT_TYPE_ANY else content_type
     http_code, detail, content = validate_params(http_success, [HTTPSuccessful, HTTPRedirection],
                                                  detail, content, content_type)
     json_body = format_content_json_str(http_code, detail, content, content_type)
     resp = generate_response_http_format(http_success, http_kwargs, json_body,
                                          content_type=content_type, metadata=metadata)
-    RAISE_RECURSIVE_SAFEGUARD_COUNT = 0  # reset counter for future calls (don't accumulate for different requests)
+    RAISE_RECURSIVE_SAFEGUARD_STATE.count = 0  # reset counter for future calls (don't accumulate for different requests)
     return resp  # noqa
 
 
@@ -437,23 +475,65 @@ def raise_http(http_error=HTTPInternalServerError,  # type: Type[HTTPError]
 
     # fail-fast if recursion generates too many calls
     # this would happen only if a major programming error occurred within this function
-    global RAISE_RECURSIVE_SAFEGUARD_MAX    # pylint: disable=W0602,W0603
-    global RAISE_RECURSIVE_SAFEGUARD_COUNT  # pylint: disable=W0602,W0603
-    RAISE_RECURSIVE_SAFEGUARD_COUNT = RAISE_RECURSIVE_SAFEGUARD_COUNT + 1
-    if RAISE_RECURSIVE_SAFEGUARD_COUNT > RAISE_RECURSIVE_SAFEGUARD_MAX:
-        raise HTTPInternalServerError(detail="Terminated. Too many recursions of `raise_http`")
+    _raise_recursive_safeguard()
 
     # try dumping content with json format, `HTTPInternalServerError` with caller info if fails.
     # content is added manually to avoid auto-format and suppression of fields by `HTTPException`
     content_type = CONTENT_TYPE_JSON if content_type == CONTENT_TYPE_ANY else content_type
     _, detail, content = validate_params(http_error, HTTPError, detail, content, content_type)
+    return _generate_http_error(http_error, http_kwargs, detail, content, content_type, metadata, nothrow)
+
+
+def _raise_recursive_safeguard():
+    # type: () -> None
+    """
+    Increments the :func:`raise_http` recursion counter of the current thread and fails fast when exceeding the limit.
+    """
+    count = getattr(RAISE_RECURSIVE_SAFEGUARD_STATE, "count", 0) + 1
+    RAISE_RECURSIVE_SAFEGUARD_STATE.count = count
+    if count > RAISE_RECURSIVE_SAFEGUARD_MAX:
+        raise HTTPInternalServerError(detail="Terminated. Too many recursions of `raise_http`")
+
+
+def _raise_http_internal(detail,                            # type: Str
+                         content,                           # type: JSON
+                         http_kwargs=None,                  # type: Optional[ParamsType]
+                         content_type=CONTENT_TYPE_JSON,    # type: Str
+                         metadata=None,                     # type: Optional[JSON]
+                         ):                                 # type: (...) -> NoReturn
+    """
+    Raises :class:`HTTPInternalServerError` for errors detected by the utilities of this module.
+
+    Contrary to :func:`raise_http`, parameters are not validated since they are generated by those utilities.
+    The recursion safeguard is still applied in case the response generation itself keeps failing.
+    """
+    _raise_recursive_safeguard()
+    content_type = CONTENT_TYPE_JSON if content_type == CONTENT_TYPE_ANY else content_type
+    _generate_http_error(HTTPInternalServerError, http_kwargs, detail, content, content_type, metadata)
+
+
+def _generate_http_error(http_error,    # type: Type[HTTPError]
+                         http_kwargs,   # type: Optional[ParamsType]
+                         detail,        # type: Str
+                         content,       # type: JSON
+                         content_type,  # type: Str
+                         metadata,      # type: Optional[JSON]
+                         nothrow=False  # type: bool
+                         ):             # type: (...) -> NoReturn
+    """
+    Generates and raises (or returns with :paramref:`nothrow`) the error HTTP response from validated parameters.
+
+    .. seealso::
+        - :func:`raise_http`
+        - :func:`_raise_http_internal`
+    """
     json_body = format_content_json_str(http_error.code, detail, content, content_type)
     resp = generate_response_http_format(http_error, http_kwargs, json_body,
                                          content_type=content_type, metadata=metadata)
 
     # reset counter for future calls (don't accumulate for different requests)
     # following raise is the last in the chain since it wasn't triggered by other functions
-    RAISE_RECURSIVE_SAFEGUARD_COUNT = 0
+    RAISE_RECURSIVE_SAFEGUARD_STATE.count = 0
     if nothrow:
         return resp
     raise resp
@@ -480,7 +560,12 @@ def validate_params(http_class,     # type: Type[HTTPException]
     # verify input arguments, raise `HTTPInternalServerError` with caller info if invalid
     # cannot be done within a try/except because it would always trigger with `raise_http`
     content = {} if content is None else content
-    detail = repr(detail) if not isinstance(detail, six.string_types) else detail
+    detail = detail if isinstance(detail, str) else repr(detail)
+    http_base = (http_base, ) if isinstance(http_base, type) else tuple(http_base)
+    validated_key = (http_class, http_base, content_type)
+    if isclass(http_class) and isinstance(content_type, str) and validated_key in _VALIDATED_HTTP_PARAMS:
+        return _VALIDATED_HTTP_PARAMS[validated_key], detail, content
+
     caller = {"content": content, "type": content_type, "detail": detail, "code": 520}  # "unknown" code error
     verify_param(isclass(http_class), param_name="http_class", is_true=True,
                  http_error=HTTPInternalServerError, content_type=CONTENT_TYPE_JSON, content={"caller": caller},
@@ -488,23 +573,32 @@ def validate_params(http_class,     # type: Type[HTTPException]
     # if `http_class` derives from `http_base` (ex: `HTTPSuccessful` or `HTTPError`) it is of proper requested type
     # if it derives from `HTTPException`, it *could* be different than base (ex: 2xx instead of 4xx codes)
     # return 'unknown error' (520) if not of lowest level base `HTTPException`, otherwise use the available code
-    http_base = tuple(http_base if hasattr(http_base, "__iter__") else [http_base])
-    if issubclass(http_class, http_base):
-        http_code = http_class.code  # noqa
-    elif issubclass(http_class, HTTPException):
-        http_code = http_class.code
-    else:
-        http_code = 520
+    is_http_base, http_code = _resolve_http_class_code(http_class, http_base)
     caller["code"] = http_code
-    verify_param(issubclass(http_class, http_base), param_name="http_base", is_true=True,
+    verify_param(is_http_base, param_name="http_base", is_true=True,
                  http_error=HTTPInternalServerError, content_type=CONTENT_TYPE_JSON, content={"caller": caller},
                  msg_on_fail="Invalid 'http_base' derived class specified.")
-    verify_param(content_type, param_name="content_type", param_compare=SUPPORTED_ACCEPT_TYPES, is_in=True,
+    verify_param(content_type, param_name="content_type", param_compare=_SUPPORTED_ACCEPT_TYPES_SET, is_in=True,
                  http_error=HTTPInternalServerError, content_type=CONTENT_TYPE_JSON, content={"caller": caller},
                  msg_on_fail="Invalid 'content_type' specified for exception output.")
+    _VALIDATED_HTTP_PARAMS[validated_key] = http_code
     return http_code, detail, content
 
 
+def _resolve_http_class_code(http_class, http_base):
+    # type: (Type[HTTPException], Tuple[Type[HTTPException], ...]) -> Tuple[bool, int]
+    """
+    Resolves if the HTTP class derives from any of the base classes and the HTTP code to report for it.
+
+    Only called on first validation of parameters by :func:`validate_params` which memoizes the resulting HTTP code.
+    """
+    if issubclass(http_class, http_base):
+        return True, http_class.code  # noqa
+    if issubclass(http_class, HTTPException):
+        return False, http_class.code
+    return False, 520
+
+
 def format_content_json_str(http_code, detail, content, content_type):
     # type: (int, Str, JSON, Str) -> Str
     """
@@ -516,20 +610,17 @@ def format_content_json_str(http_code, detail, content, content_type):
     """
     json_body = ""
     try:
-        content["code"] = http_code
-        content["detail"] = detail
-        content["type"] = content_type
-        json_body = json.dumps(content)
+        # copy fields to leave the provided content unmodified in case it is referenced elsewhere (e.g.: error details)
+        json_body = json_dumps({**content, "code": http_code, "detail": detail, "type": content_type})
     except Exception as exc:  # pylint: disable=W0703
         msg = "Dumping json content '{!s}' resulted in exception '{!r}'.".format(content, exc)
-        raise_http(http_error=HTTPInternalServerError, detail=msg,
-                   content_type=CONTENT_TYPE_JSON,
-                   content={"traceback": repr(exc_info()),
-                            "exception": repr(exc),
-                            "caller": {"content": repr(content),  # raw string to avoid recursive json.dumps error
-                                       "detail": detail,
-                                       "code": http_code,
-                                       "type": content_type}})
+        _raise_http_internal(detail=msg,
+                             content={"traceback": repr(exc_info()),
+                                      "exception": repr(exc),
+                                      "caller": {"content": repr(content),  # raw string to avoid recursive dump error
+                                                 "detail": detail,
+                                                 "code": http_code,
+                                                 "type": content_type}})
     return json_body
 
 
@@ -549,7 +640,7 @@ def rewrite_content_type(content, content_type):
         Also provides the converted JSON body if applicable (original content was literal JSON or JSON-like string).
     """
     json_content = None
-    if isinstance(content, six.string_types):
+    if isinstance(content, str):
         try:
             content = json.loads(content)
             json_content = content
@@ -559,7 +650,7 @@ def rewrite_content_type(content, content_type):
         if "type" in content:
             content["type"] = content_type
         json_content = content
-        content = json.dumps(content)
+        content = json_dumps(content)
     return content, json_content
 
 
@@ -583,7 +674,7 @@ def generate_response_http_format(http_class, http_kwargs, content, content_type
         # preserve original JSON field ordering, as best as possible
         json_content.update({k: v for k, v in metadata.items() if k not in json_content})
         content, json_content = rewrite_content_type(json_content, content_type)
-    content = str(content) if not isinstance(content, six.string_types) else content
+    content = content if isinstance(content, str) else str(content)
 
     # adjust additional keyword arguments and try building the http response class with them
     http_kwargs = {} if http_kwargs is None else http_kwargs
@@ -615,15 +706,13 @@ def generate_response_http_format(http_class, http_kwargs, content, content_type
             if not http_class.explanation:
                 http_class.explanation = http_class.title  # some don't have any defined
             # add preformat <pre> section to output as is within the <body> section
-            html_status = "Exception" if http_class.code >= 400 else "Response"
-            html_header = "{}<br><h2>{} Details</h2>".format(http_class.explanation, html_status)
-            html_template = "<pre style='word-wrap: break-word; white-space: pre-wrap;'>{}</pre>"
+            html_details = _HTML_EXCEPTION_DETAILS if http_class.code >= 400 else _HTML_RESPONSE_DETAILS
             content_type = "{}; charset=UTF-8".format(CONTENT_TYPE_HTML)
             if json_content:
-                html_body = html_template.format(json.dumps(json_content, indent=True, ensure_ascii=False))
+                html_content = json.dumps(json_content, indent=True, ensure_ascii=False)
             else:
-                html_body = html_template.format(content)
-            html_body = html_header + html_body
+                html_content = content
+            html_body = "".join((http_class.explanation, html_details, html_content, _HTML_DETAILS_END))
             http_response = http_class(body_template=html_body, content_type=content_type, **http_kwargs)
 
         elif content_type in [CONTENT_TYPE_APP_XML, CONTENT_TYPE_TXT_XML]:
@@ -636,8 +725,8 @@ def generate_response_http_format(http_class, http_kwargs, content, content_type
 
         return http_response
     except Exception as exc:  # pylint: disable=W0703
-        raise_http(http_error=HTTPInternalServerError, detail="Failed to build HTTP response",
-                   content={"traceback": repr(exc_info()), "exception": repr(exc),
-                            "caller": {"http_kwargs": repr(http_kwargs),
-                                       "http_class": repr(http_class),
-                                       "content_type": str(content_type)}})
+        _raise_http_internal(detail="Failed to build HTTP response",
+                             content={"traceback": repr(exc_info()), "exception": repr(exc),
+                                      "caller": {"http_kwargs": repr(http_kwargs),
+                                                 "http_class": repr(http_class),
+                                                 "content_type": str(content_type)}})
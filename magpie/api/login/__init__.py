@@ -4,11 +4,29 @@ LOGGER = get_logger(__name__)
 
 
 def includeme(config):
+    from pyramid.security import NO_PERMISSION_REQUIRED
+    from ziggurat_foundations.ext.pyramid.sign_in import ZigguratSignInBadAuth, ZigguratSignInSuccess, ZigguratSignOut
+
     from magpie.api import schemas as s
+    from magpie.api.login import login
+
     LOGGER.info("Adding API login...")
     # Add all the rest api routes
     config.add_route(**s.service_api_route_info(s.SessionAPI))
     config.add_route(**s.service_api_route_info(s.SigninAPI))
     config.add_route(**s.service_api_route_info(s.ProvidersAPI))
     config.add_route(**s.service_api_route_info(s.ProviderSigninAPI))
-    config.scan()
+    # views registered explicitly since they are all known (avoid scanning every module of the package)
+    config.add_view(login.get_session_view, route_name=s.SessionAPI.name, permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.signin_in_param_view, route_name=s.SigninAPI.name, request_method="GET",
+                    permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.sign_in_view, route_name=s.SigninAPI.name, request_method="POST",
+                    permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.get_providers_view, route_name=s.ProvidersAPI.name, request_method="GET",
+                    permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.authomatic_login_view, route_name=s.ProviderSigninAPI.name,
+                    permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.login_success_ziggurat_view, context=ZigguratSignInSuccess,
+                    permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.login_failure_view, context=ZigguratSignInBadAuth, permission=NO_PERMISSION_REQUIRED)
+    config.add_view(login.sign_out_view, context=ZigguratSignOut, permission=NO_PERMISSION_REQUIRED)
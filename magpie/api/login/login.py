@@ -21,7 +21,6 @@ from pyramid.httpexceptions import (
 from pyramid.request import Request
 from pyramid.response import Response
 from pyramid.security import NO_PERMISSION_REQUIRED, forget, remember
-from pyramid.view import view_config
 from six.moves.urllib.parse import urlparse
 from ziggurat_foundations.ext.pyramid.sign_in import ZigguratSignInBadAuth, ZigguratSignInSuccess, ZigguratSignOut
 from ziggurat_foundations.models.services.external_identity import ExternalIdentityService
@@ -89,7 +88,6 @@ def verify_provider(provider_name):
 
 
 @s.SigninAPI.get(schema=s.Signin_GET_RequestSchema, tags=[s.SessionTag], response_schemas=s.Signin_GET_responses)
-@view_config(route_name=s.SigninAPI.name, request_method="GET", permission=NO_PERMISSION_REQUIRED)
 def signin_in_param_view(request):
     """
     Signs in a user session using query parameters.
@@ -111,7 +109,6 @@ def signin_in_param_view(request):
 
 
 @s.SigninAPI.post(schema=s.Signin_POST_RequestSchema, tags=[s.SessionTag], response_schemas=s.Signin_POST_responses)
-@view_config(route_name=s.SigninAPI.name, request_method="POST", permission=NO_PERMISSION_REQUIRED)
 def sign_in_view(request):
     """
     Signs in a user session.
@@ -159,7 +156,6 @@ def sign_in_view(request):
         return resp
 
 
-@view_config(context=ZigguratSignInSuccess, permission=NO_PERMISSION_REQUIRED)
 def login_success_ziggurat_view(request):
     """
     Response from redirect upon successful login with valid user credentials.
@@ -174,7 +170,6 @@ def login_success_ziggurat_view(request):
                          detail=s.Signin_POST_OkResponseSchema.description)
 
 
-@view_config(context=ZigguratSignInBadAuth, permission=NO_PERMISSION_REQUIRED)
 def login_failure_view(request, reason=None):
     """
     Response from redirect upon login failure, either because of invalid or incorrect user credentials.
@@ -273,7 +268,6 @@ def login_success_external(request, external_user_name, external_id, email, prov
 
 @s.ProviderSigninAPI.get(schema=s.ProviderSignin_GET_RequestSchema, tags=[s.SessionTag],
                          response_schemas=s.ProviderSignin_GET_responses)
-@view_config(route_name=s.ProviderSigninAPI.name, permission=NO_PERMISSION_REQUIRED)
 def authomatic_login_view(request):
     """
     Signs in a user session using an external provider.
@@ -344,7 +338,6 @@ def authomatic_login_view(request):
 
 
 @s.SignoutAPI.get(tags=[s.SessionTag], response_schemas=s.Signout_GET_responses)
-@view_config(context=ZigguratSignOut, permission=NO_PERMISSION_REQUIRED)
 def sign_out_view(request):
     """
     Signs out the current user session.
@@ -354,7 +347,6 @@ def sign_out_view(request):
 
 
 @s.SessionAPI.get(tags=[s.SessionTag], response_schemas=s.Session_GET_responses)
-@view_config(route_name=s.SessionAPI.name, permission=NO_PERMISSION_REQUIRED)
 def get_session_view(request):
     """
     Get information about current session.
@@ -374,7 +366,6 @@ def get_session_view(request):
 
 
 @s.ProvidersAPI.get(tags=[s.SessionTag], response_schemas=s.Providers_GET_responses)
-@view_config(route_name=s.ProvidersAPI.name, request_method="GET", permission=NO_PERMISSION_REQUIRED)
 def get_providers_view(request):     # noqa: F811
     """
     Get list of login providers.
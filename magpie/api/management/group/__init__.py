@@ -1,4 +1,5 @@
 from magpie.api import schemas as s
+from magpie.constants import get_constant
 from magpie.utils import get_logger
 
 LOGGER = get_logger(__name__)
@@ -18,4 +19,11 @@ def includeme(config):
     config.add_route(**s.service_api_route_info(s.GroupResourcePermissionsAPI))
     config.add_route(**s.service_api_route_info(s.GroupResourcePermissionAPI))
 
+    # groups that cannot be modified or deleted, resolved once since settings do not change after startup
+    settings = config.get_settings()
+    config.registry["magpie.special_groups"] = frozenset([
+        get_constant("MAGPIE_ANONYMOUS_GROUP", settings_container=settings),
+        get_constant("MAGPIE_ADMIN_GROUP", settings_container=settings),
+    ])
+
     config.scan()
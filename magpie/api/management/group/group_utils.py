@@ -11,7 +11,6 @@ from pyramid.httpexceptions import (
 )
 from pyramid.settings import asbool
 from ziggurat_foundations.models.services.group import GroupService
-from ziggurat_foundations.models.services.group_resource_permission import GroupResourcePermissionService
 from ziggurat_foundations.models.services.resource import ResourceService
 
 from magpie import models
@@ -27,7 +26,7 @@ from magpie.services import SERVICE_TYPE_DICT
 
 if TYPE_CHECKING:
     # pylint: disable=W0611,unused-import
-    from typing import Iterable, List, Optional
+    from typing import Dict, Iterable, List, Optional, Tuple
 
     from pyramid.httpexceptions import HTTPException
     from sqlalchemy.orm.session import Session
@@ -41,29 +40,43 @@ def get_all_group_names(db_session):
     Get all existing group names from the database.
     """
     group_names = ax.evaluate_call(
-        lambda: [grp.group_name for grp in GroupService.all(models.Group, db_session=db_session)],
+        lambda: [grp.group_name for grp in db_session.query(models.Group.group_name)],
         http_error=HTTPForbidden, msg_on_fail=s.Groups_GET_ForbiddenResponseSchema.description)
     return group_names
 
 
+def get_group_user_names(group, db_session):
+    # type: (models.Group, Session) -> List[Str]
+    """
+    Get the names of all users that are members of the group.
+
+    Only names are queried to avoid loading every member :class:`models.User` through the group relationship.
+    """
+    user_names = db_session.query(models.User.user_name) \
+                           .join(models.UserGroup, models.UserGroup.user_id == models.User.id) \
+                           .filter(models.UserGroup.group_id == group.id)
+    return [user_name for user_name, in user_names]
+
+
 def get_group_resources(group, db_session, service_types=None):
     # type: (models.Group, Session, Optional[List[Str]]) -> JSON
     """
     Get formatted JSON body describing all service resources the ``group`` as permissions on.
     """
     json_response = {}
-    if service_types is None:
-        service_types = list(SERVICE_TYPE_DICT)
+    service_types = set(SERVICE_TYPE_DICT if service_types is None else service_types)
+    svc_perms_dict, svc_res_perms_dict = get_group_services_resources_permissions_dicts(group, db_session)
     for svc in list(ResourceService.all(models.Service, db_session=db_session)):
         svc_type = str(svc.type)
         if svc_type not in service_types:
             continue
-        svc_perms = get_group_service_permissions(group=group, service=svc, db_session=db_session)
+        if svc.owner_group_id == group.id:
+            svc_perms = get_group_service_permissions(group=group, service=svc, db_session=db_session)
+        else:
+            svc_perms = svc_perms_dict.get(svc.resource_id, [])
         svc_name = str(svc.resource_name)
-        if svc_type not in json_response:
-            json_response[svc_type] = {}
-        res_perm_dict = get_group_service_resources_permissions_dict(group=group, service=svc, db_session=db_session)
-        json_response[svc_type][svc_name] = sf.format_service_resources(
+        res_perm_dict = svc_res_perms_dict.get(svc.resource_id, {})
+        json_response.setdefault(svc_type, {})[svc_name] = sf.format_service_resources(
             svc,
             db_session=db_session,
             service_perms=svc_perms,
@@ -108,15 +121,15 @@ def create_group(group_name, description, discoverable, terms, db_session):
                              description=description,
                              discoverable=discoverable,
                              terms=terms),  # noqa
-        fallback=lambda: db_session.rollback(), http_error=HTTPForbidden, content=group_content_error,
+        http_error=HTTPForbidden, content=group_content_error,
         msg_on_fail=s.Groups_POST_ForbiddenCreateResponseSchema.description)
     ax.evaluate_call(lambda: db_session.add(new_group), fallback=lambda: db_session.rollback(),
                      http_error=HTTPForbidden, content=group_content_error,
                      msg_on_fail=s.Groups_POST_ForbiddenAddResponseSchema.description)
-    # re-fetch the created group to update fields with auto-generated group ID
-    new_group = ax.evaluate_call(lambda: GroupService.by_group_name(group_name, db_session=db_session),
-                                 http_error=HTTPForbidden,
-                                 msg_on_fail=s.Groups_POST_ForbiddenAddResponseSchema.description)
+    # flush the created group to update fields with auto-generated group ID, without re-fetching it
+    ax.evaluate_call(lambda: db_session.flush(), fallback=lambda: db_session.rollback(),
+                     http_error=HTTPForbidden, content=group_content_error,
+                     msg_on_fail=s.Groups_POST_ForbiddenAddResponseSchema.description)
     return ax.valid_http(http_success=HTTPCreated, detail=s.Groups_POST_CreatedResponseSchema.description,
                          content={"group": format_group(new_group, basic_info=True)})
 
@@ -130,9 +143,11 @@ def get_similar_group_resource_permission(group, resource, permission, db_sessio
     """
     permission.type = PermissionType.APPLIED
     res_id = resource.resource_id
-    err_content = {"group": format_group(group, basic_info=True),
-                   "resource": format_resource(resource, basic_info=True),
-                   "permission_name": str(permission), "permission": permission.json()}
+
+    def err_content():  # only generated for error responses
+        return {"group": format_group(group, basic_info=True),
+                "resource": format_resource(resource, basic_info=True),
+                "permission_name": str(permission), "permission": permission.json()}
 
     def is_similar_permission():
         perms_dict = get_group_resources_permissions_dict(group, resource_ids=[res_id], db_session=db_session)
@@ -185,7 +200,7 @@ def create_group_resource_permission_response(group, resource, permission, db_se
 
     new_perm = ax.evaluate_call(
         lambda: models.GroupResourcePermission(resource_id=resource_id, group_id=group.id, perm_name=str(permission)),
-        fallback=lambda: db_session.rollback(), http_error=HTTPForbidden, content=perm_content,
+        http_error=HTTPForbidden, content=perm_content,
         msg_on_fail=s.GroupResourcePermissions_POST_ForbiddenCreateResponseSchema.description)
     ax.evaluate_call(lambda: db_session.add(new_perm), fallback=lambda: db_session.rollback(),
                      http_error=HTTPForbidden, content=perm_content,
@@ -207,10 +222,7 @@ def get_group_resources_permissions_dict(group, db_session, resource_ids=None, r
             grp, resource_ids=res_ids, resource_types=res_types, db_session=db)
         res_perms_dict = {}
         for res_perm in res_perms_tup:
-            if res_perm.resource.resource_id not in res_perms_dict:
-                res_perms_dict[res_perm.resource.resource_id] = [PermissionSet(res_perm)]
-            else:
-                res_perms_dict[res_perm.resource.resource_id].append(PermissionSet(res_perm))
+            res_perms_dict.setdefault(res_perm.resource.resource_id, []).append(PermissionSet(res_perm))
         return res_perms_dict
 
     return ax.evaluate_call(lambda: get_grp_res_perm(group, db_session, resource_ids, resource_types),
@@ -221,6 +233,36 @@ def get_group_resources_permissions_dict(group, db_session, resource_ids=None, r
                                      "resource_types": repr(resource_types)})
 
 
+def get_group_services_resources_permissions_dicts(group, db_session):
+    # type: (models.Group, Session) -> Tuple[ResourcePermissionMap, Dict[int, ResourcePermissionMap]]
+    """
+    Get all permissions that a group has on services and resources, using a single query.
+
+    Permissions are split into two dictionaries indexed by service ID. The first one contains the permissions applied
+    directly on services, as returned by :func:`get_group_service_permissions` for services not owned by the group.
+    The second one contains for each service the same mapping of nested resources and corresponding permissions as
+    returned by :func:`get_group_service_resources_permissions_dict`.
+    """
+    def get_grp_svc_res_perms(grp, db):
+        svc_perms_dict = {}
+        svc_res_perms_dict = {}
+        for res_perm in GroupService.resources_with_possible_perms(grp, db_session=db):
+            res = res_perm.resource
+            if res.root_service_id is None:
+                perm = PermissionSet(res_perm.perm_name, typ=PermissionType.APPLIED)
+                svc_perms_dict.setdefault(res.resource_id, []).append(perm)
+            else:
+                res_perms_dict = svc_res_perms_dict.setdefault(res.root_service_id, {})
+                res_perms_dict.setdefault(res.resource_id, []).append(PermissionSet(res_perm))
+        return svc_perms_dict, svc_res_perms_dict
+
+    return ax.evaluate_call(lambda: get_grp_svc_res_perms(group, db_session),
+                            fallback=lambda: db_session.rollback(),
+                            http_error=HTTPInternalServerError,
+                            msg_on_fail=s.GroupResourcesPermissions_InternalServerErrorResponseSchema.description,
+                            content={"group": repr(group)})
+
+
 def get_group_resource_permissions_response(group, resource, db_session):
     # type: (models.Group, models.Resource, Session) -> HTTPException
     """
@@ -267,16 +309,26 @@ def delete_group_resource_permission_response(group, resource, permission, db_se
         found_perm = get_similar_group_resource_permission(group, resource, permission, db_session=db_session)
     else:
         found_perm = permission
-    del_perm = GroupResourcePermissionService.get(group.id, res_id, str(found_perm), db_session=db_session)
     permission.type = PermissionType.APPLIED
-    perm_content = {"permission_name": str(permission), "permission": permission.json(),
-                    "resource": format_resource(resource, basic_info=True),
-                    "group": format_group(group, basic_info=True)}
-    ax.verify_param(del_perm, not_none=True, http_error=HTTPNotFound, content=perm_content,
+
+    def perm_content():  # only generated for error responses
+        return {"permission_name": str(permission), "permission": permission.json(),
+                "resource": format_resource(resource, basic_info=True),
+                "group": format_group(group, basic_info=True)}
+
+    def del_grp_res_perm():
+        # delete directly with a single statement instead of fetching the permission to then delete it
+        return db_session.query(models.GroupResourcePermission) \
+                         .filter_by(group_id=group.id, resource_id=res_id, perm_name=str(found_perm)) \
+                         .delete()
+
+    del_count = 0
+    if found_perm is not None:
+        del_count = ax.evaluate_call(lambda: del_grp_res_perm(), fallback=lambda: db_session.rollback(),
+                                     http_error=HTTPForbidden, content=perm_content,
+                                     msg_on_fail=s.GroupServicePermission_DELETE_ForbiddenResponseSchema.description)
+    ax.verify_param(del_count > 0, is_true=True, with_param=False, http_error=HTTPNotFound, content=perm_content,
                     msg_on_fail=s.GroupServicePermission_DELETE_NotFoundResponseSchema.description)
-    ax.evaluate_call(lambda: db_session.delete(del_perm), fallback=lambda: db_session.rollback(),
-                     http_error=HTTPForbidden, content=perm_content,
-                     msg_on_fail=s.GroupServicePermission_DELETE_ForbiddenResponseSchema.description)
     webhook_params = get_permission_update_params(group, resource, permission, db_session)
     process_webhook_requests(WebhookAction.DELETE_GROUP_PERMISSION, webhook_params)
     return ax.valid_http(http_success=HTTPOk, detail=s.GroupServicePermission_DELETE_OkResponseSchema.description)
@@ -288,17 +340,21 @@ def get_group_services(resources_permissions_dict, db_session, service_types=Non
     Nest and regroup the resource permissions under corresponding root service types.
     """
     grp_svc_dict = {}
-    if service_types is None:
-        service_types = list(SERVICE_TYPE_DICT)
+    service_types = set(SERVICE_TYPE_DICT if service_types is None else service_types)
+    if not resources_permissions_dict:
+        return grp_svc_dict
+    # fetch all services at once rather than one query per resource
+    services = db_session.query(models.Service).filter(
+        models.Service.resource_id.in_(list(resources_permissions_dict))
+    )
+    svc_by_id = {svc.resource_id: svc for svc in services}
     for res_id, perms in resources_permissions_dict.items():
-        svc = ResourceService.by_resource_id(resource_id=res_id, db_session=db_session)
+        svc = svc_by_id[res_id]
         svc_type = str(svc.type)
         if svc_type not in service_types:
             continue
         svc_name = str(svc.resource_name)
-        if svc_type not in grp_svc_dict:
-            grp_svc_dict[svc_type] = {}
-        grp_svc_dict[svc_type][svc_name] = sf.format_service(svc, perms, show_private_url=False)
+        grp_svc_dict.setdefault(svc_type, {})[svc_name] = sf.format_service(svc, perms, show_private_url=False)
     return grp_svc_dict
 
 
@@ -316,7 +372,7 @@ def get_group_services_response(group, db_session, service_types=None):
     grp_svc_json = ax.evaluate_call(lambda: get_group_services(res_perm_dict, db_session, service_types=service_types),
                                     http_error=HTTPInternalServerError,
                                     msg_on_fail=s.GroupServices_InternalServerErrorResponseSchema.description,
-                                    content={"group": format_group(group, basic_info=True)})
+                                    content=lambda: {"group": format_group(group, basic_info=True)})
     return ax.valid_http(http_success=HTTPOk, detail=s.GroupServices_GET_OkResponseSchema.description,
                          content={"services": grp_svc_json})
 
@@ -355,7 +411,7 @@ def get_group_service_permissions_response(group, service, db_session):
         lambda: format_permissions(get_group_service_permissions(group, service, db_session), PermissionType.APPLIED),
         http_error=HTTPInternalServerError,
         msg_on_fail=s.GroupServicePermissions_GET_InternalServerErrorResponseSchema.description,
-        content={"group": format_group(group, basic_info=True), "service": sf.format_service(service)})
+        content=lambda: {"group": format_group(group, basic_info=True), "service": sf.format_service(service)})
     return ax.valid_http(http_success=HTTPOk, content=svc_perms_found,
                          detail=s.GroupServicePermissions_GET_OkResponseSchema.description)
 
@@ -365,9 +421,9 @@ def get_group_service_resources_permissions_dict(group, service, db_session):
     """
     Get all permissions the group has on a specific service's children resources.
     """
-    res_id = service.resource_id
-    res_under_svc = models.RESOURCE_TREE_SERVICE.from_parent_deeper(parent_id=res_id, db_session=db_session)
-    res_ids = [resource.Resource.resource_id for resource in res_under_svc]
+    res_under_svc = db_session.query(models.Resource.resource_id) \
+                              .filter(models.Resource.root_service_id == service.resource_id)
+    res_ids = [resource.resource_id for resource in res_under_svc]
     return get_group_resources_permissions_dict(group, db_session, resource_types=None, resource_ids=res_ids)
 
 
@@ -3,6 +3,7 @@ from pyramid.settings import asbool
 from pyramid.view import view_config
 from ziggurat_foundations.models.services.group import GroupService
 
+from magpie import models
 from magpie.api import exception as ax
 from magpie.api import requests as ar
 from magpie.api import schemas as s
@@ -55,10 +56,7 @@ def edit_group_view(request):
     Update a group by name.
     """
     group = ar.get_group_matchdict_checked(request, group_name_key="group_name")
-    special_groups = [
-        get_constant("MAGPIE_ANONYMOUS_GROUP", settings_container=request),
-        get_constant("MAGPIE_ADMIN_GROUP", settings_container=request),
-    ]
+    special_groups = request.registry["magpie.special_groups"]
     ax.verify_param(group.group_name, not_in=True, param_compare=special_groups, param_name="group_name",
                     http_error=HTTPForbidden,
                     msg_on_fail=s.Group_PATCH_ReservedKeyword_ForbiddenResponseSchema.description)
@@ -68,14 +66,18 @@ def edit_group_view(request):
     new_discoverability = ar.get_multiformat_body(request, "discoverable")
     if new_discoverability is not None:
         new_discoverability = asbool(new_discoverability)
-    update_name = group.group_name != new_group_name and new_group_name is not None
-    update_desc = group.description != new_description and new_description is not None
-    update_disc = group.discoverable != new_discoverability and new_discoverability is not None
-    ax.verify_param(any([update_name, update_desc, update_disc]), is_true=True,
+    group_changes = {}
+    if new_group_name is not None and group.group_name != new_group_name:
+        group_changes["group_name"] = new_group_name
+    if new_description is not None and group.description != new_description:
+        group_changes["description"] = new_description
+    if new_discoverability is not None and group.discoverable != new_discoverability:
+        group_changes["discoverable"] = new_discoverability
+    ax.verify_param(group_changes, not_empty=True,
                     with_param=False,  # params are not useful in response for this case
                     http_error=HTTPBadRequest, content={"group_name": group.group_name},
                     msg_on_fail=s.Group_PATCH_None_BadRequestResponseSchema.description)
-    if update_name:
+    if "group_name" in group_changes:
         ax.verify_param(new_group_name, not_none=True, not_empty=True, http_error=HTTPBadRequest,
                         msg_on_fail=s.Group_PATCH_Name_BadRequestResponseSchema.description)
         group_name_size_range = range(1, 1 + get_constant("MAGPIE_GROUP_NAME_MAX_LENGTH", settings_container=request))
@@ -85,11 +87,9 @@ def edit_group_view(request):
         ax.verify_param(GroupService.by_group_name(new_group_name, db_session=request.db),
                         is_none=True, http_error=HTTPConflict, with_param=False,  # don't return group as value
                         msg_on_fail=s.Group_PATCH_ConflictResponseSchema.description)
-        group.group_name = new_group_name
-    if update_desc:
-        group.description = new_description
-    if update_disc:
-        group.discoverable = new_discoverability
+        models.forget_request_group(group.group_name, request)
+    # update only modified columns, also synchronizing the group instance of the session
+    request.db.query(models.Group).filter(models.Group.id == group.id).update(group_changes)
     return ax.valid_http(http_success=HTTPOk, detail=s.Group_PATCH_OkResponseSchema.description)
 
 
@@ -100,16 +100,14 @@ def delete_group_view(request):
     Delete a group by name.
     """
     group = ar.get_group_matchdict_checked(request)
-    special_groups = [
-        get_constant("MAGPIE_ANONYMOUS_GROUP", settings_container=request),
-        get_constant("MAGPIE_ADMIN_GROUP", settings_container=request),
-    ]
+    special_groups = request.registry["magpie.special_groups"]
     ax.verify_param(group.group_name, not_in=True, param_compare=special_groups, param_name="group_name",
                     http_error=HTTPForbidden,
                     msg_on_fail=s.Group_DELETE_ReservedKeyword_ForbiddenResponseSchema.description)
     ax.evaluate_call(lambda: request.db.delete(group),
                      fallback=lambda: request.db.rollback(), http_error=HTTPForbidden,
                      msg_on_fail=s.Group_DELETE_ForbiddenResponseSchema.description)
+    models.forget_request_group(group.group_name, request)
     return ax.valid_http(http_success=HTTPOk, detail=s.Group_DELETE_OkResponseSchema.description)
 
 
@@ -130,7 +128,7 @@ def get_group_users_view(request):
     status = UserGroupStatus.get(status)
 
     user_names = set()
-    member_user_names = ax.evaluate_call(lambda: set(user.user_name for user in group.users),
+    member_user_names = ax.evaluate_call(lambda: set(gu.get_group_user_names(group, request.db)),
                                          http_error=HTTPForbidden,
                                          msg_on_fail=s.GroupUsers_GET_ForbiddenResponseSchema.description)
     if status in [UserGroupStatus.ACTIVE, UserGroupStatus.ALL]:
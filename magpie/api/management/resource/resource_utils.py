@@ -249,7 +249,8 @@ def get_resource_permissions(resource, db_session):
         return SERVICE_TYPE_DICT[service.type].permissions
 
     # otherwise obtain root level service to infer sub-resource permissions
-    service = ResourceService.by_resource_id(resource.root_service_id, db_session=db_session)
+    # lookup by primary key reuses the service already loaded in the session when checked multiple times by a request
+    service = db_session.query(models.Resource).get(resource.root_service_id)
     ax.verify_param(service.resource_type, is_equal=True, http_error=HTTPBadRequest,
                     param_name="resource_type", param_compare=models.Service.resource_type_name,
                     msg_on_fail=s.UserResourcePermissions_GET_BadRequestRootServiceResponseSchema.description)
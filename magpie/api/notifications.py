@@ -1,16 +1,19 @@
+import atexit
 import os
-import smtplib
+import threading
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from mako.template import Template
 from pyramid.settings import asbool
 
 from magpie.constants import get_constant
 from magpie.utils import get_logger, get_magpie_url, get_settings, raise_log
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Union
+    import smtplib
+    from typing import Any, Dict, Optional, Tuple, Union
+
+    from mako.template import Template
 
     from magpie.typedefs import AnySettingsContainer, SettingsType, Str, TypedDict
 
@@ -38,6 +41,10 @@ DEFAULT_TEMPLATE_MAPPING = {
     "MAGPIE_USER_REGISTRATION_NOTIFY_EMAIL_TEMPLATE":
         os.path.join(TEMPLATE_DIR, "email_user_registration_notify.mako"),
 }
+# opened SMTP connections reused for following emails sent by the same thread, with their server configuration
+SMTP_CONNECTIONS = {}  # type: Dict[int, Tuple[SMTPServerConfiguration, Union[smtplib.SMTP, smtplib.SMTP_SSL]]]
+# compiled templates with their modification time indexed by file path, to avoid parsing them again for every email
+EMAIL_TEMPLATE_CACHE = {}  # type: Dict[Str, Tuple[float, Template]]
 
 
 def get_email_template(template_constant, container=None):
@@ -66,6 +73,12 @@ def get_email_template(template_constant, container=None):
     if not isinstance(template_file, str) or not os.path.isfile(template_file) or not template_file.endswith(".mako"):
         raise_log("Email template [{}] missing or invalid from [{!s}]".format(template_constant, template_file),
                   IOError, logger=LOGGER)
+    # modification time allows edited override templates to be applied without restarting the application
+    template_mtime = os.path.getmtime(template_file)
+    cached_mtime, template = EMAIL_TEMPLATE_CACHE.get(template_file, (None, None))
+    if template is not None and cached_mtime == template_mtime:
+        return template
+    from mako.template import Template  # noqa: F811  # pylint: disable=C0415,W0621  # defer heavy import
     filters = [
         "decode.utf8",  # email expected with Content-Type charset=UTF-8
         "trim",
@@ -74,6 +87,7 @@ def get_email_template(template_constant, container=None):
     template = Template(filename=template_file,     # nosec: B702  # mako escapes against XSS attacks
                         default_filters=filters,
                         strict_undefined=True)      # report name of any missing variable reference
+    EMAIL_TEMPLATE_CACHE[template_file] = (template_mtime, template)
     return template
 
 
@@ -125,6 +139,8 @@ def get_smtp_server_connection(config):
 
     If the connection is correctly instantiated, the returned SMTP server will be ready for sending emails.
     """
+    import smtplib  # noqa: F811  # pylint: disable=C0415,W0621  # defer import until emails are sent
+
     if config["ssl"]:
         server = smtplib.SMTP_SSL(config["host"], config["port"])
     else:
@@ -142,8 +158,62 @@ def get_smtp_server_connection(config):
     return server
 
 
+def get_smtp_server_reused_connection(config):
+    # type: (SMTPServerConfiguration) -> Union[smtplib.SMTP, smtplib.SMTP_SSL]
+    """
+    Obtains an opened connection to a SMTP server, reusing the one previously opened by the current thread if possible.
+
+    The previous connection is reused only if it was established with the same configuration and that the server still
+    responds to it. Otherwise, it is closed and a new connection is established.
+
+    .. seealso::
+        :func:`get_smtp_server_connection`
+    """
+    import smtplib  # noqa: F811  # pylint: disable=C0415,W0621  # defer import until emails are sent
+
+    thread_id = threading.get_ident()
+    previous_config, server = SMTP_CONNECTIONS.get(thread_id, (None, None))
+    if server is not None:
+        if previous_config == config:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                LOGGER.debug("SMTP connection of previous email expired, establishing a new one.")
+        close_smtp_server_connection()
+    server = get_smtp_server_connection(config)
+    SMTP_CONNECTIONS[thread_id] = (config, server)
+    return server
+
+
+def close_smtp_server_connection(thread_id=None):
+    # type: (Optional[int]) -> None
+    """
+    Closes the SMTP connection opened by the current or specified thread, if any remains.
+    """
+    import smtplib  # noqa: F811  # pylint: disable=C0415,W0621  # defer import until emails are sent
+
+    _, server = SMTP_CONNECTIONS.pop(threading.get_ident() if thread_id is None else thread_id, (None, None))
+    if server is None:
+        return
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+@atexit.register
+def close_smtp_server_connections():
+    # type: () -> None
+    """
+    Closes all remaining SMTP connections when the application terminates.
+    """
+    for thread_id in list(SMTP_CONNECTIONS):
+        close_smtp_server_connection(thread_id)
+
+
 def make_email_contents(config, settings, template, parameters=None):
-    # type: (SMTPServerConfiguration, SettingsType, Template, Optional[TemplateParameters]) -> Str
+    # type: (SMTPServerConfiguration, SettingsType, Template, Optional[TemplateParameters]) -> bytes
     """
     Generates the email contents using the template, substitution parameters, and the target email server configuration.
     """
@@ -161,8 +231,7 @@ def make_email_contents(config, settings, template, parameters=None):
     }
     params.update(parameters or {})
     contents = template.render(**params)
-    message = "{}".format(contents).strip("\n")
-    return message.encode("utf8")
+    return contents.strip("\n").encode("utf8")
 
 
 def send_email(recipient, container, template, parameters=None):
@@ -199,8 +268,8 @@ def send_email(recipient, container, template, parameters=None):
     params["email_recipient"] = recipient
     message = make_email_contents(config, settings, template, params)
 
-    LOGGER.debug("Creating SMTP connection to send email using config: %s.", config)
-    server = get_smtp_server_connection(config)
+    LOGGER.debug("Obtaining SMTP connection to send email using config: %s.", config)
+    server = get_smtp_server_reused_connection(config)
 
     result = None
     try:
@@ -212,9 +281,8 @@ def send_email(recipient, container, template, parameters=None):
         LOGGER.error("Failure during notification email to: [%s] using template [%s]. "
                      "Error: %r", recipient, template.filename, exc)
         LOGGER.debug("Email contents:\n\n%s\n", message, exc_info=exc)
-        # don't re-raise here (see docstring)
-    finally:
-        server.quit()
+        # don't re-raise here (see docstring), but do not reuse a connection that could be left in an invalid state
+        close_smtp_server_connection()
     if result:
         LOGGER.debug("Unexpected error result from SMTP server during email notification:\n%s", result)
         return False
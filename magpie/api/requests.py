@@ -10,7 +10,6 @@ from pyramid.httpexceptions import (
     HTTPNotFound,
     HTTPUnprocessableEntity
 )
-from ziggurat_foundations.models.services.group import GroupService
 from ziggurat_foundations.models.services.resource import ResourceService
 from ziggurat_foundations.models.services.user import UserService
 
@@ -277,7 +276,7 @@ def get_group_matchdict_checked(request, group_name_key="group_name"):
     :raises HTTPNotFound: if the specified group name does not correspond to any existing group.
     """
     group_name = get_value_matchdict_checked(request, group_name_key)
-    group = ax.evaluate_call(lambda: GroupService.by_group_name(group_name, db_session=request.db),
+    group = ax.evaluate_call(lambda: models.get_request_group(group_name, request),
                              fallback=lambda: request.db.rollback(), http_error=HTTPForbidden,
                              msg_on_fail=s.Group_MatchDictCheck_ForbiddenResponseSchema.description)
     ax.verify_param(group, not_none=True, http_error=HTTPNotFound,
@@ -10,6 +10,13 @@ if TYPE_CHECKING:
 
     from magpie.typedefs import JSON
 
+# Swagger UI template data does not depend on the request
+SWAGGER_UI_DATA = {
+    "api_title": s.TitleAPI,
+    "api_schema_path": s.SwaggerGenerator.path.lstrip("/"),
+    "api_schema_versions_dir": os.path.abspath(os.path.join(MAGPIE_MODULE_DIR, "ui/swagger/versions")),
+}
+
 
 @s.SwaggerAPI.get(tags=[s.APITag], api_security=s.SecurityEveryoneAPI,
                   response_schemas=s.SwaggerAPI_GET_responses)
@@ -17,12 +24,7 @@ def api_swagger(request):   # noqa: F811
     """
     Swagger UI route to display the Magpie REST API schemas.
     """
-    swagger_versions_dir = "{}".format(os.path.abspath(os.path.join(MAGPIE_MODULE_DIR, "ui/swagger/versions")))
-    swagger_ui_path = s.SwaggerGenerator.path.lstrip("/")
-    return_data = {"api_title": s.TitleAPI,
-                   "api_schema_path": swagger_ui_path,
-                   "api_schema_versions_dir": swagger_versions_dir}
-    return return_data
+    return dict(SWAGGER_UI_DATA)  # copy to avoid renderer modifications of the shared definition
 
 
 @s.SwaggerGenerator.get(tags=[s.APITag], api_security=s.SecurityEveryoneAPI,
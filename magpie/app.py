@@ -166,9 +166,11 @@ def main(global_config=None, **settings):  # noqa: F811
         config.add_tween(tween_name, under=tween_position)
     config.add_tween(fully_qualified_name(validate_accept_header_tween), under=EXCVIEW, over=MAIN)
 
+    # NOTE:
+    #   Only include template engines that are employed. Mako templates are required by API views (swagger UI, message
+    #   pages), even when the UI is disabled. No Chameleon template is defined, so there is no need to load its engine.
     config.include("cornice")
     config.include("cornice_swagger")
-    config.include("pyramid_chameleon")
     config.include("pyramid_beaker")
     config.include("pyramid_mako")
 
@@ -11,6 +11,7 @@ settings formatted as ``magpie.[variable_name]`` in the ``magpie.ini`` configura
     constant ``MAGPIE_INI_FILE_PATH`` (or any other `path variable` defined before it - see below) has to be defined
     by environment variable if the default location is not desired (ie: if you want to provide your own configuration).
 """
+import functools
 import logging
 import os
 import re
@@ -171,6 +172,7 @@ MAGPIE_CONSTANTS = [
 _REGEX_ASCII_ONLY = re.compile(r"\W|^(?=\d)")
 
 
+@functools.lru_cache(maxsize=None)
 def get_constant_setting_name(name):
     # type: (Str) -> Str
     """
@@ -178,6 +180,9 @@ def get_constant_setting_name(name):
 
     Lower-case name and replace all non-ascii chars by `_`.
     Then, convert known prefixes with their dotted name.
+
+    Results are memoized since the conversion only depends on the name and is repeated by every :func:`get_constant`
+    call that does not find the constant directly in the settings.
     """
     name = re.sub(_REGEX_ASCII_ONLY, "_", name.strip().lower())
     for prefix in ["magpie", "twitcher", "postgres", "phoenix"]:
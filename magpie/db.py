@@ -128,6 +128,17 @@ def get_tm_session(session_factory, transaction_manager):
     return db_session
 
 
+def get_request_db_session(request):
+    # type: (Request) -> Session
+    """
+    Get a ``sqlalchemy.orm.Session`` instance backed by the transaction manager of the request.
+
+    Employed as ``request.db`` method, using the session factory registered in the application registry under
+    ``dbsession_factory`` and the transaction manager ``request.tm`` provided by ``pyramid_tm``.
+    """
+    return get_tm_session(request.registry["dbsession_factory"], request.tm)
+
+
 def get_session_from_other(db_session):
     return get_session_factory(db_session.bind)
 
@@ -292,12 +303,8 @@ def includeme(config):
     # use pyramid_tm to hook the transaction lifecycle to the request
     config.include("pyramid_tm")
     session_factory = get_session_factory(get_engine(config))
-    config.registry["db_session_factory"] = session_factory
+    config.registry["dbsession_factory"] = session_factory
+    config.registry["db_session_factory"] = session_factory  # backward compatibility
 
     # make `request.db` available for use in Pyramid
-    config.add_request_method(
-        # r.tm is the transaction manager used by pyramid_tm
-        lambda r: get_tm_session(session_factory, r.tm),
-        "db",
-        reify=True
-    )
+    config.add_request_method(get_request_db_session, "db", reify=True)
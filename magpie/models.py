@@ -561,7 +561,7 @@ class RootFactory(object):
         # allow if role MAGPIE_ADMIN_PERMISSION is somehow directly set instead of inferred via members of admin-group
         acl = [(Allow, get_constant("MAGPIE_ADMIN_PERMISSION", self.request), ALL_PERMISSIONS)]
         admin_group_name = get_constant("MAGPIE_ADMIN_GROUP", self.request)
-        admins = GroupService.by_group_name(admin_group_name, db_session=self.request.db)
+        admins = get_request_group(admin_group_name, self.request)
         if admins:
             # need to add explicit admin-group ALL_PERMISSIONS otherwise views with other permissions than the
             # default MAGPIE_ADMIN_PERMISSION will be refused access (e.g.: views with MAGPIE_LOGGED_PERMISSION)
@@ -1028,3 +1028,37 @@ def find_children_by_name(child_name, parent_id, db_session):
     tree_level_filtered = [node.Resource for node in list(tree_struct) if
                            node.Resource.resource_name.lower() == child_name.lower()]
     return tree_level_filtered.pop() if len(tree_level_filtered) else None
+
+
+def get_request_group(group_name, request):
+    # type: (Str, Request) -> Optional[Group]
+    """
+    Obtains a group by name, reusing the result of a previous lookup of that group while processing the same request.
+
+    This avoids repeating the same query when a group is resolved many times while processing a request (e.g.:
+    administrators group employed for the ACL and requested by the view). Groups are memoized on the request object
+    rather than on its database session, since the thread-local session is reused across requests and could otherwise
+    return groups renamed or deleted in the meantime. Missing groups are not memoized in order to find them if they get
+    created afterwards within the same request.
+
+    .. seealso::
+        :func:`forget_request_group` to remove the memoized group following its modification
+    """
+    groups = getattr(request, "_groups_prefetched", None)  # type: Optional[Dict[Str, Group]]
+    if groups is None:
+        groups = {}
+        setattr(request, "_groups_prefetched", groups)
+    group = groups.get(group_name)
+    if group is None or sa.inspect(group).detached:
+        group = GroupService.by_group_name(group_name, db_session=request.db)
+        if group is not None:
+            groups[group_name] = group
+    return group
+
+
+def forget_request_group(group_name, request):
+    # type: (Str, Request) -> None
+    """
+    Removes a group memoized by :func:`get_request_group` when it gets renamed or deleted.
+    """
+    getattr(request, "_groups_prefetched", {}).pop(group_name, None)
@@ -10,7 +10,7 @@ from magpie.utils import ExtendedEnum
 
 if TYPE_CHECKING:
     # pylint: disable=W0611,unused-import
-    from typing import Any, Collection, Dict, List, Optional, Union
+    from typing import Any, Collection, Dict, FrozenSet, List, Optional, Tuple, Union
 
     from magpie import models
     from magpie.typedefs import (
@@ -576,6 +576,40 @@ class PermissionSet(object):
         return PermissionSet(perm, access, scope, perm_type)
 
 
+def _format_permission_sets(permissions):
+    # type: (List[PermissionSet]) -> Tuple[List[Str], List[PermissionDict]]
+    """
+    Obtains the implicit+explicit permission names and JSON representations of already sorted permissions.
+    """
+    bw_perm_names = []      # to preserve insert order
+    bw_perm_unique = set()  # for quick remove of duplicates
+    for perm in permissions:
+        implicit_perm = perm.implicit_permission
+        explicit_perm = perm.explicit_permission
+        if implicit_perm is not None and implicit_perm not in bw_perm_unique:
+            bw_perm_names.append(implicit_perm)
+            bw_perm_unique.add(implicit_perm)
+        if explicit_perm not in bw_perm_unique:
+            bw_perm_names.append(explicit_perm)
+            bw_perm_unique.add(explicit_perm)
+    return bw_perm_names, [perm.json() for perm in permissions]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_allowed_permissions(permission_names):
+    # type: (FrozenSet[Permission]) -> Tuple[Tuple[Str, ...], Tuple[PermissionDict, ...]]
+    """
+    Obtains the formatted representations of every combination of :class:`Access` and :class:`Scope` of the names.
+
+    Since allowed permissions only depend on the set of :class:`Permission` names (defined by services and resources),
+    the generated results are cached. Callers must copy the returned items before modifying them.
+    """
+    perms_list = sorted([PermissionSet(name, access, scope, PermissionType.ALLOWED)
+                         for name, access, scope in itertools.product(permission_names, Access, Scope)])
+    bw_perm_names, json_perms = _format_permission_sets(perms_list)
+    return tuple(bw_perm_names), tuple(json_perms)
+
+
 def format_permissions(permissions,             # type: Optional[Collection[AnyPermissionType]]
                        permission_type=None,    # type: Optional[PermissionType]
                        force_unique=True,       # type: bool
@@ -616,25 +650,16 @@ def format_permissions(permissions,             # type: Optional[Collection[AnyP
     if permission_type is None:
         permission_type = PermissionType.ALLOWED
     if permissions:
-        bw_perm_unique = set()  # for quick remove of duplicates
         perms_list = [PermissionSet(perm, typ=permission_type) for perm in permissions]
-        if force_unique:
-            perms_list = set(perms_list)
-        perms_list = sorted(perms_list)
         if permission_type == PermissionType.ALLOWED:
-            unique_names = {perm.name for perm in perms_list}  # trim out any extra variations, then build full list
-            perms_list = sorted([PermissionSet(name, access, scope, PermissionType.ALLOWED)
-                                 for name, access, scope in itertools.product(unique_names, Access, Scope)])
-        for perm in perms_list:
-            implicit_perm = perm.implicit_permission
-            explicit_perm = perm.explicit_permission
-            if implicit_perm is not None and implicit_perm not in bw_perm_unique:
-                bw_perm_names.append(implicit_perm)
-                bw_perm_unique.add(implicit_perm)
-            if explicit_perm not in bw_perm_names:
-                bw_perm_names.append(explicit_perm)
-                bw_perm_unique.add(explicit_perm)
-        json_perms = [perm.json() for perm in perms_list]
+            unique_names = frozenset(perm.name for perm in perms_list)  # trim out any extra variations
+            bw_perm_names, json_perms = _format_allowed_permissions(unique_names)
+            bw_perm_names = list(bw_perm_names)
+            json_perms = [dict(perm) for perm in json_perms]
+        else:
+            if force_unique:
+                perms_list = set(perms_list)
+            bw_perm_names, json_perms = _format_permission_sets(sorted(perms_list))
     for perm in json_perms:
         perm.setdefault("type", permission_type.value)
     return {
@@ -1,5 +1,7 @@
 import abc
+import functools
 import re
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import six
@@ -32,7 +34,7 @@ from magpie.utils import classproperty, fully_qualified_name, get_logger, get_re
 LOGGER = get_logger(__name__)
 if TYPE_CHECKING:
     # pylint: disable=W0611,unused-import
-    from typing import Collection, Dict, List, Optional, Set, Tuple, Type, Union
+    from typing import Collection, Dict, List, Mapping, Optional, Set, Tuple, Type, Union
 
     from pyramid.request import Request
 
@@ -1557,41 +1559,44 @@ class ServiceGeoserver(ServiceGeoserverBase):
         return self._config
 
     @classproperty
+    @functools.lru_cache(maxsize=None)  # combined once from static definitions of supported services
     def params_expected(cls):  # noqa  # pylint: disable=E0213,no-self-argument,W0221,arguments-differ
-        # type: () -> List[Str]
+        # type: () -> Tuple[Str, ...]
         params = set()
         for svc in cls.service_supported:
             if issubclass(svc, ServiceOWS):
                 param_names = getattr(svc, "params_expected", None)
                 if param_names:
                     params.update(param_names)
-        return list(params)
+        return tuple(params)  # immutable since the same memoized result is shared by all callers
 
     @classproperty
+    @functools.lru_cache(maxsize=None)  # combined once from static definitions of supported services
     def permissions(cls):  # noqa  # pylint: disable=E0213,no-self-argument,W0221,arguments-differ
-        # type: () -> List[Permission]
+        # type: () -> Tuple[Permission, ...]
         perms = set()
         for svc in cls.service_supported:
             if issubclass(svc, ServiceOWS):
                 svc_perms = getattr(svc, "permissions", None)
                 if svc_perms:
                     perms.update(svc.permissions)
-        return list(perms)
+        return tuple(perms)  # immutable since the same memoized result is shared by all callers
 
     @classproperty
+    @functools.lru_cache(maxsize=None)  # combined once from static definitions of supported services
     def resource_types_permissions(cls):  # noqa  # pylint: disable=E0213,no-self-argument,W0221,arguments-differ
-        # type: () -> ResourceTypePermissions
-        perms = {}  # type: ResourceTypePermissions
+        # type: () -> Mapping[Type[models.Resource], Tuple[Permission, ...]]
+        perms = {}  # type: Dict[Type[models.Resource], Tuple[Permission, ...]]
         for svc in cls.service_supported:
             if issubclass(svc, ServiceOWS):
                 svc_res_perms = getattr(svc, "resource_types_permissions", None)
                 if svc_res_perms:
                     for res_type, res_perms in svc_res_perms.items():
                         if res_type in perms:
-                            perms[res_type] = list(set(perms[res_type]) | set(res_perms))
+                            perms[res_type] = tuple(set(perms[res_type]) | set(res_perms))
                         else:
-                            perms[res_type] = list(res_perms)
-        return perms
+                            perms[res_type] = tuple(res_perms)
+        return MappingProxyType(perms)  # read-only since the same memoized result is shared by all callers
 
     def __init__(self, service, request):
         # type: (models.Service, Optional[Request]) -> None
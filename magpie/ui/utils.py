@@ -1,4 +1,3 @@
-import json
 from secrets import compare_digest  # noqa 'python2-secrets'
 from typing import TYPE_CHECKING
 
@@ -18,6 +17,7 @@ from pyramid.view import view_defaults
 
 from magpie import __meta__
 from magpie.api import schemas
+from magpie.api.exception import json_dumps
 from magpie.api.generic import get_exception_info, get_request_info
 from magpie.api.requests import get_logged_user
 from magpie.constants import get_constant
@@ -35,6 +35,15 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger(__name__)
 
+# package details applied to the heading of every UI page
+UI_TEMPLATE_METADATA = {
+    "MAGPIE_TITLE": __meta__.__title__,
+    "MAGPIE_AUTHOR": __meta__.__author__,
+    "MAGPIE_VERSION": __meta__.__version__,
+    "MAGPIE_SOURCE_URL": __meta__.__url__,
+    "MAGPIE_DESCRIPTION": __meta__.__description__,
+}
+
 
 def check_response(response):
     # type: (AnyResponseType) -> AnyResponseType
@@ -62,8 +71,7 @@ def request_api(request,            # type: Request
     If they are passed as argument, corresponding values will override the ones found in :paramref:`request`.
 
     All sub-requests to the API are assumed to be :py:data:`magpie.common.CONTENT_TYPE_JSON` unless explicitly
-    overridden with :paramref:`headers`. Headers are also looked for additional ``Set-Cookie`` header in case they
-    need to be passed down to :paramref:`cookies`.
+    overridden with :paramref:`headers`. Cookies are passed down to the sub-request with its ``Cookie`` header.
 
     :param request: incoming Magpie UI request that requires sub-request to Magpie API, to retrieve required details.
     :param path: local Magpie API path (relative to root without URL).
@@ -77,26 +85,26 @@ def request_api(request,            # type: Request
     method = method.upper()
     extra_kwargs = {"method": method}
 
+    # body-less HEAD/GET/OPTIONS requests skip the body setup entirely (no POST data nor Content-Type)
+    no_body = method in ("HEAD", "GET", "OPTIONS") and not data
     if headers:
         headers = dict(headers)
+    elif no_body:
+        headers = {"Accept": CONTENT_TYPE_JSON}
     else:
         headers = {"Accept": CONTENT_TYPE_JSON, "Content-Type": CONTENT_TYPE_JSON}
-    # although no body is required per-say for HEAD/GET requests, add it if missing
-    # this avoids downstream errors when 'request.POST' is accessed
-    # we use a plain empty byte str because empty dict `{}` or `None` cause errors on each case
-    # of local/remote testing with corresponding `webtest.TestApp`/`requests.Request`
-    if method not in ("HEAD", "GET", "OPTIONS"):
+    if not no_body:
+        # other methods add an empty body if missing, which avoids downstream errors when 'request.POST' is accessed
+        # we use a plain empty byte str because empty dict `{}` or `None` cause errors on each case
+        # of local/remote testing with corresponding `webtest.TestApp`/`requests.Request`
         if not data:
             data = ""
         if isinstance(data, dict) and get_header("Content-Type", headers, split=[",", ";"]) == CONTENT_TYPE_JSON:
-            data = json.dumps(data)
+            data = json_dumps(data)
+        extra_kwargs["POST"] = data
 
     if hasattr(cookies, "items"):  # any dict-like implementation
         cookies = list(cookies.items())
-    if cookies and isinstance(headers, dict):
-        headers = list(headers.items())
-        for cookie_name, cookie_value in cookies:
-            headers.append(("Set-Cookie", "{}={}".format(cookie_name, cookie_value)))
     if cookies is None:
         cookies = request.cookies
     # cookies must be added to kw only if populated, iterable error otherwise
@@ -110,7 +118,7 @@ def request_api(request,            # type: Request
             cookies = [(name, value.split(";")[0]) for name, value in cookies]
         extra_kwargs["cookies"] = cookies
 
-    subreq = Request.blank(path, base_url=request.application_url, headers=headers, POST=data, **extra_kwargs)
+    subreq = Request.blank(path, base_url=request.application_url, headers=headers, **extra_kwargs)
     resp = request.invoke_subrequest(subreq, use_tweens=True)
     return resp
 
@@ -175,39 +183,70 @@ def handle_errors(func):
     return wrap
 
 
+def get_fixed_constants(request):
+    # type: (Request) -> Dict[Str, Any]
+    """
+    Obtains the special :term:`User` and :term:`Group` references employed by UI pages.
+
+    Values are resolved from configuration settings on first call and cached in the application registry afterwards.
+    Collections are immutable since the same cached references are assigned to every view instance.
+    """
+    registry = request.registry
+    constants = registry.get("magpie.ui.fixed_constants")
+    if constants is None:
+        anonym_grp = get_constant("MAGPIE_ANONYMOUS_GROUP", settings_container=request)
+        admin_grp = get_constant("MAGPIE_ADMIN_GROUP", settings_container=request)
+        # special users that cannot be deleted
+        anonym_usr = get_constant("MAGPIE_ANONYMOUS_USER", request)
+        admin_usr = get_constant("MAGPIE_ADMIN_USER", request)
+        registration = asbool(get_constant("MAGPIE_USER_REGISTRATION_ENABLED", request, default_value=False,
+                                           print_missing=True, raise_missing=False, raise_not_set=False))
+        constants = registry["magpie.ui.fixed_constants"] = {
+            "MAGPIE_FIXED_GROUP_MEMBERSHIPS": (anonym_grp, ),
+            "MAGPIE_FIXED_GROUP_EDITS": (anonym_grp, admin_grp),
+            "MAGPIE_FIXED_USERS_REFS": (anonym_usr, ),
+            "MAGPIE_FIXED_USERS": (admin_usr, anonym_usr),
+            "MAGPIE_USER_PWD_LOCKED": (admin_usr, ),
+            "MAGPIE_USER_PWD_DISABLED": (anonym_usr, admin_usr),
+            "MAGPIE_USER_REGISTRATION_ENABLED": registration,
+            "MAGPIE_ANONYMOUS_GROUP": anonym_grp,
+        }
+    return constants
+
+
 @view_defaults(decorator=handle_errors)
 class BaseViews(object):
     """
     Base methods for Magpie UI pages.
     """
-    MAGPIE_FIXED_GROUP_MEMBERSHIPS = []
+    MAGPIE_FIXED_GROUP_MEMBERSHIPS = ()
     """
     Special :term:`Group` memberships that cannot be edited.
     """
 
-    MAGPIE_FIXED_GROUP_EDITS = []
+    MAGPIE_FIXED_GROUP_EDITS = ()
     """
     Special :term:`Group` details that cannot be edited.
     """
 
-    MAGPIE_FIXED_USERS = []
+    MAGPIE_FIXED_USERS = ()
     """
     Special :term:`User` details that cannot be edited.
     """
 
-    MAGPIE_FIXED_USERS_REFS = []
+    MAGPIE_FIXED_USERS_REFS = ()
     """
     Special :term:`User` that cannot have any relationship edited.
 
     This includes both :term:`Group` memberships and :term:`Permission` references.
     """
 
-    MAGPIE_USER_PWD_LOCKED = []
+    MAGPIE_USER_PWD_LOCKED = ()
     """
     Special :term:`User` that *could* self-edit themselves, but is disabled since conflicting with other policies.
     """
 
-    MAGPIE_USER_PWD_DISABLED = []
+    MAGPIE_USER_PWD_DISABLED = ()
     """
     Special :term:`User` where password cannot be edited (managed by `Magpie` configuration settings).
     """
@@ -223,22 +262,10 @@ class BaseViews(object):
         self.ui_theme = get_constant("MAGPIE_UI_THEME", self.request)
         self.logged_user = get_logged_user(self.request)
 
-        anonym_grp = get_constant("MAGPIE_ANONYMOUS_GROUP", settings_container=self.request)
-        admin_grp = get_constant("MAGPIE_ADMIN_GROUP", settings_container=self.request)
-        self.__class__.MAGPIE_FIXED_GROUP_MEMBERSHIPS = [anonym_grp]
-        self.__class__.MAGPIE_FIXED_GROUP_EDITS = [anonym_grp, admin_grp]
-        # special users that cannot be deleted
-        anonym_usr = get_constant("MAGPIE_ANONYMOUS_USER", self.request)
-        admin_usr = get_constant("MAGPIE_ADMIN_USER", self.request)
-        self.__class__.MAGPIE_FIXED_USERS_REFS = [anonym_usr]
-        self.__class__.MAGPIE_FIXED_USERS = [admin_usr, anonym_usr]
-        self.__class__.MAGPIE_USER_PWD_LOCKED = [admin_usr]
-        self.__class__.MAGPIE_USER_PWD_DISABLED = [anonym_usr, admin_usr]
-        self.__class__.MAGPIE_USER_REGISTRATION_ENABLED = asbool(
-            get_constant("MAGPIE_USER_REGISTRATION_ENABLED", self.request,
-                         default_value=False, print_missing=True, raise_missing=False, raise_not_set=False)
-        )
-        self.__class__.MAGPIE_ANONYMOUS_GROUP = anonym_grp
+        # special groups/users are resolved from settings only once, then cached in the application registry
+        # values are set on the instance to avoid concurrent requests writing to the shared class attributes
+        for name, value in get_fixed_constants(self.request).items():
+            setattr(self, name, value)
 
     def add_template_data(self, data=None):
         # type: (Optional[Dict[Str, Any]]) -> Dict[Str, Any]
@@ -246,14 +273,8 @@ class BaseViews(object):
         Adds required template data for the 'heading' mako template applied to every UI page.
         """
         all_data = data or {}
-        all_data.update({
-            "MAGPIE_URL": self.magpie_url,
-            "MAGPIE_TITLE": __meta__.__title__,
-            "MAGPIE_AUTHOR": __meta__.__author__,
-            "MAGPIE_VERSION": __meta__.__version__,
-            "MAGPIE_SOURCE_URL": __meta__.__url__,
-            "MAGPIE_DESCRIPTION": __meta__.__description__,
-        })
+        all_data.update(UI_TEMPLATE_METADATA)
+        all_data["MAGPIE_URL"] = self.magpie_url
         all_data.setdefault("MAGPIE_SUB_TITLE", "Administration")
         all_data.setdefault("MAGPIE_UI_THEME", self.ui_theme)
         all_data.setdefault("MAGPIE_FIXED_GROUP_MEMBERSHIPS", self.MAGPIE_FIXED_GROUP_MEMBERSHIPS)
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 
 import requests
 import six
+from pyramid.authentication import BadTicket
 from pyramid.config import ConfigurationError, Configurator
 from pyramid.httpexceptions import HTTPClientError, HTTPException, HTTPOk
 from pyramid.interfaces import IResponseFactory
@@ -45,8 +46,9 @@ else:
 if TYPE_CHECKING:
     # pylint: disable=W0611,unused-import
     from typing import _TC  # noqa: E0611,F401,W0212 # pylint: disable=E0611
-    from typing import Any, Callable, List, NoReturn, Optional, Type, Union
+    from typing import Any, Callable, List, NoReturn, Optional, Tuple, Type, Union
 
+    from pyramid.authentication import AuthTktCookieHelper
     from pyramid.events import NewRequest
     from pyramid_retry import BeforeRetry
 
@@ -159,10 +161,13 @@ def print_log(msg, logger=None, level=logging.INFO, **kwargs):
 
     if not logger:
         logger = get_logger(__name__)
-    if MAGPIE_LOG_PRINT:
-        set_logger_config(logger, force_stdout=True)
     if logger.disabled:
         logger.disabled = False
+    # skip handler setup when the message would be filtered anyway (e.g.: frequent debug messages of 'get_constant')
+    if not logger.isEnabledFor(level):
+        return
+    if MAGPIE_LOG_PRINT:
+        set_logger_config(logger, force_stdout=True)
     logger.log(level, msg, **kwargs)
 
 
@@ -329,7 +334,7 @@ def setup_session_config(config):
     """
     Setup database :class:`Session` transaction handlers and :class:`Request` properties for active :term:`User`.
     """
-    from magpie.db import get_engine, get_session_factory, get_tm_session
+    from magpie.db import get_engine, get_request_db_session, get_session_factory
 
     settings = get_settings(config)
 
@@ -363,10 +368,7 @@ def setup_session_config(config):
     config.include("pyramid_tm")
     session_factory = get_session_factory(get_engine(settings))
     config.registry["dbsession_factory"] = session_factory
-    config.add_request_method(
-        # 'request.tm' is the transaction manager used by 'pyramid_tm'
-        lambda request: get_tm_session(session_factory, request.tm), "db", reify=True
-    )
+    config.add_request_method(get_request_db_session, "db", reify=True)
     config.add_tween(fully_qualified_name(cleanup_session), under=INGRESS)
 
     def debug_request_user(request):
@@ -428,8 +430,16 @@ def debug_cookie_identify(request):
         - :class:`pyramid.authentication.AuthTktCookieHelper`
         - :class:`pyramid.authentication.AuthTktAuthenticationPolicy`
     """
+    # avoid evaluating all logging arguments (and parsing the ticket) if they would not be logged anyway
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
+
     # pylint: disable=W0212
-    cookie_inst = request._get_authentication_policy().cookie  # noqa: W0212
+    policy = request._get_authentication_policy()  # noqa: W0212  # single registry lookup, reused below
+    cookie_inst = getattr(policy, "cookie", None)  # type: Optional[AuthTktCookieHelper]
+    if cookie_inst is None:
+        LOGGER.debug("No cookie authentication policy!")
+        return
     cookie = request.cookies.get(cookie_inst.cookie_name)
 
     LOGGER.debug("Cookie (name: %s, secret: %s, hash-alg: %s) : %s",
@@ -446,16 +456,18 @@ def debug_cookie_identify(request):
 
         LOGGER.debug("Cookie remote addr (include_ip: %s) : %s", cookie_inst.include_ip, remote_addr)
         now = time.time()
-        timestamp, _, _, _ = cookie_inst.parse_ticket(cookie_inst.secret, cookie, remote_addr, cookie_inst.hashalg)
+        try:
+            timestamp, _, _, _ = cookie_inst.parse_ticket(cookie_inst.secret, cookie, remote_addr, cookie_inst.hashalg)
+        except BadTicket as exc:
+            # same reason that will make 'identify' return no identity when called by 'get_request_user'
+            LOGGER.debug("Cookie ticket is invalid: %s", exc)
+            return
         LOGGER.debug("Cookie timestamp: %s, timeout: %s, now: %s", timestamp, cookie_inst.timeout, now)
 
         if cookie_inst.timeout and ((timestamp + cookie_inst.timeout) < now):
             # the auth_tkt data has expired
             LOGGER.debug("Cookie is expired")
 
-        # Could raise useful exception explaining why unauthenticated_userid is None
-        request._get_authentication_policy().cookie.identify(request)  # noqa: W0212
-
 
 def get_request_user(request):
     # type: (Request) -> Optional[models.User]
@@ -1009,6 +1021,26 @@ def log_exception_tween(handler, registry):  # noqa: F811
     return log_exc
 
 
+_VERSION_NUMBER_REGEX = re.compile(r"^\d+")
+
+
+def parse_version_numbers(version):
+    # type: (Str) -> Tuple[int, int, int]
+    """
+    Obtain the ``(major, minor, patch)`` numbers of a dotted version string as a directly comparable tuple.
+
+    Any missing part is considered as zero, and any non-numeric suffix (e.g.: pre-release) is ignored.
+    This is sufficient to compare against known release versions without loading a full version parser.
+    """
+    numbers = [0, 0, 0]
+    for idx, part in enumerate(str(version).split(".")[:3]):
+        match = _VERSION_NUMBER_REGEX.match(part)
+        if not match:
+            break
+        numbers[idx] = int(match.group())
+    return tuple(numbers)
+
+
 def is_json_body(body, return_body=False):
     # type: (Any, bool) -> bool
     if not body:
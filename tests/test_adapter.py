@@ -1,3 +1,4 @@
+import contextlib
 import json
 import os
 import random
@@ -27,6 +28,7 @@ from tests import runner, utils
 from twitcher.__version__ import __version__ as twitcher_version  # noqa
 
 if six.PY3:
+    from magpie.adapter import get_verify_session
     from magpie.adapter.magpieowssecurity import MagpieOWSSecurity, OWSAccessForbidden  # noqa: F401
 
 if TYPE_CHECKING:
@@ -68,6 +70,8 @@ class TestAdapter(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTestCase):
         cls.test_service_type = ServiceAPI.service_type
         cls.test_resource_name = "test"
         cls.test_resource_type = "route"
+        cls.test_service_path = "/ows/proxy/{}".format(cls.test_service_name)
+        cls.test_resource_path = "{}/{}".format(cls.test_service_path, cls.test_resource_name)
 
         cls.setup_adapter()
         cls.setup_admin()
@@ -92,7 +96,7 @@ class TestAdapter(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTestCase):
         self.test_headers = None
         self.test_cookies = None
 
-        path = "/ows/proxy/{}".format(self.test_service_name)
+        path = self.test_service_path
         req = self.mock_request(path, method="GET")
         utils.check_raises(lambda: self.ows.check_request(req), OWSAccessForbidden, msg="Using [GET, {}]".format(path))
         req = self.mock_request(path, method="POST")
@@ -107,7 +111,7 @@ class TestAdapter(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTestCase):
         self.test_headers = None
         self.test_cookies = None
 
-        path = "/ows/proxy/{}/{}".format(self.test_service_name, self.test_resource_name)
+        path = self.test_resource_path
         req = self.mock_request(path, method="GET")
         utils.check_raises(lambda: self.ows.check_request(req), OWSAccessForbidden, msg="Using [GET, {}]".format(path))
         req = self.mock_request(path, method="POST")
@@ -121,7 +125,7 @@ class TestAdapter(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTestCase):
         self.login_test_user()
 
         # validate it works correctly for known service
-        path = "/ows/proxy/{}".format(self.test_service_name)
+        path = self.test_service_path
         req = self.mock_request(path, method="GET")
         utils.check_no_raise(lambda: self.ows.check_request(req), msg="Using [GET, {}]".format(path))
 
@@ -143,14 +147,14 @@ class TestAdapter(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTestCase):
         self.login_test_user()
 
         # validate it works correctly for known Magpie resource
-        path = "/ows/proxy/{}/{}".format(self.test_service_name, self.test_resource_name)
+        path = self.test_resource_path
         req = self.mock_request(path, method="GET")
         utils.check_no_raise(lambda: self.ows.check_request(req), msg="Using [GET, {}]".format(path))
 
         # resource is unknown, but user permission grants access to whatever 'resource' is supposedly located there
         # up to underlying service to return whichever status is appropriate, but request is forwarded as considered
         # resolved for Magpie/Twitcher roles
-        path = "/ows/proxy/{}/{}".format(self.test_service_name, "unittest-unknown-resource")
+        path = "{}/{}".format(self.test_service_path, "unittest-unknown-resource")
         req = self.mock_request(path, method="GET")
         utils.check_no_raise(lambda: self.ows.check_request(req), msg="Using [GET, {}]".format(path))
 
@@ -445,13 +449,14 @@ class BaseTestAdapterCaching(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTest
         cls.test_service_name = "unittest-adapter-cache-service"
         cls.test_service_type = ServiceAPI.service_type
         cls.test_resource_type = "route"
+        cls.test_service_path = "/ows/proxy/{}".format(cls.test_service_name)
 
     @utils.mocked_get_settings
     def setUp(self):
         self.reset_cached_app(settings=self.cache_settings)
         ti.UserTestCase.setUp(self)
         self.cookies = None
-        self.headers, self.cookies = utils.check_or_try_login_user(self, self.usr, self.pwd, use_ui_form_submit=True)
+        self.headers, self.cookies = utils.check_or_try_login_user(self, self.usr, self.pwd)
         self.require = "cannot run tests without logged in user with '{}' permissions".format(self.grp)
         self.login_admin()
         utils.TestSetup.delete_TestService(self)
@@ -494,13 +499,18 @@ class BaseTestAdapterCaching(ti.SetupMagpieAdapter, ti.UserTestCase, ti.BaseTest
 
         # wrap 'get_service' which calls the cached method '_get_service_cached', which in turn calls 'service_factory'
         # when caching takes effect, 'service_factory' does not get called as the cached service is returned directly
-        with utils.wrapped_call(MagpieOWSSecurity, "get_service", self.ows) as mock_service_cached:
-            with utils.wrapped_call("magpie.adapter.magpieowssecurity.service_factory",
-                                    side_effect=mocked_service_factory) as mock_service_factory:
-                # wrap '__acl__' which calls '_get_acl_cached', that in turns calls '_get_acl' when resolving real ACL
-                with utils.wrapped_call(ServiceInterface, "__acl__", service) as mock_acl_cached:
-                    with utils.wrapped_call(ServiceInterface, "_get_acl", service) as mock_acl_resolve:
-                        operations()
+        with contextlib.ExitStack() as stack:
+            mock_service_cached = stack.enter_context(
+                utils.wrapped_call(MagpieOWSSecurity, "get_service", self.ows)
+            )
+            mock_service_factory = stack.enter_context(
+                utils.wrapped_call("magpie.adapter.magpieowssecurity.service_factory",
+                                   side_effect=mocked_service_factory)
+            )
+            # wrap '__acl__' which calls '_get_acl_cached', that in turns calls '_get_acl' when resolving real ACL
+            mock_acl_cached = stack.enter_context(utils.wrapped_call(ServiceInterface, "__acl__", service))
+            mock_acl_resolve = stack.enter_context(utils.wrapped_call(ServiceInterface, "_get_acl", service))
+            operations()
         return mock_service_cached, mock_service_factory, mock_acl_cached, mock_acl_resolve
 
 
@@ -531,7 +541,7 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
             with utils.wrapped_call("magpie.adapter.magpieowssecurity.service_factory") as mock_service:
 
                 # initial request to ensure functions get cached once from scratch
-                path = "/ows/proxy/{}".format(self.test_service_name)
+                path = self.test_service_path
                 msg = "Using [GET, {}]".format(path)
                 req = self.mock_request(path, method="GET", headers=admin_no_cache, cookies=admin_cookies)
                 utils.check_no_raise(lambda: self.ows.check_request(req), msg=msg)
@@ -562,7 +572,7 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
             with utils.wrapped_call("magpie.adapter.magpieowssecurity.service_factory") as wrapped_cached:
 
                 # always hit the same endpoint for each request
-                path = "/ows/proxy/{}".format(self.test_service_name)
+                path = self.test_service_path
                 msg = "Using [GET, {}]".format(path)
 
                 # initial request to ensure functions get cached once from scratch
@@ -608,14 +618,13 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
         # service not allowed access, resource allowed
         res1_name = "test1"
         res2_name = "test2"
-        res1_path = "/ows/proxy/{}/{}".format(self.test_service_name, res1_name)
-        res2_path = "/ows/proxy/{}/{}".format(self.test_service_name, res2_name)
+        res1_path = "{}/{}".format(self.test_service_path, res1_name)
+        res2_path = "{}/{}".format(self.test_service_path, res2_name)
         info = utils.TestSetup.create_TestServiceResource(self, override_resource_name=res1_name)
         utils.TestSetup.create_TestUserResourcePermission(self, resource_info=info, override_permission="read")
         info = utils.TestSetup.create_TestServiceResource(self, override_resource_name=res2_name)
         utils.TestSetup.create_TestUserResourcePermission(self, resource_info=info, override_permission="write")
 
-        no_cache_header = self.cache_reset_headers.copy()
         admin_cookies = self.cookies.copy()
         admin_headers = self.headers.copy()
         self.login_test_user()
@@ -625,38 +634,42 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
         self.test_headers = None
         self.test_cookies = None
 
-        test_requests = [
-            # allowed because admin
-            (True, self.mock_request(res1_path, method="GET", headers=admin_headers, cookies=admin_cookies)),
-            (True, self.mock_request(res1_path, method="POST", headers=admin_headers, cookies=admin_cookies)),
-            (True, self.mock_request(res2_path, method="GET", headers=admin_headers, cookies=admin_cookies)),
-            (True, self.mock_request(res2_path, method="POST", headers=admin_headers, cookies=admin_cookies)),
-            # allowed/denied based on (user, resource, permission) combination
-            (True, self.mock_request(res1_path, method="GET", headers=user_headers, cookies=user_cookies)),
-            (False, self.mock_request(res1_path, method="POST", headers=user_headers, cookies=user_cookies)),
-            (False, self.mock_request(res2_path, method="GET", headers=user_headers, cookies=user_cookies)),
-            (True, self.mock_request(res2_path, method="POST", headers=user_headers, cookies=user_cookies)),
+        # user name of each request is kept alongside to avoid resolving it from cookies for every check
+        admin = "admin"
+        user = self.test_user_name
+        # (path, method, allowed for user) combinations, always allowed for admin
+        test_cases = [
+            (res1_path, "GET", True),
+            (res1_path, "POST", False),
+            (res2_path, "GET", False),
+            (res2_path, "POST", True),
         ]
+
+        def make_requests(_admin_headers, _user_headers):
+            return [
+                (True, admin, self.mock_request(path, method=method, headers=_admin_headers, cookies=admin_cookies))
+                for path, method, _ in test_cases
+            ] + [
+                (allowed, user, self.mock_request(path, method=method, headers=_user_headers, cookies=user_cookies))
+                for path, method, allowed in test_cases
+            ]
+
+        # distinct requests with/without the no-cache header, instead of updating the headers before each check
+        test_requests = tuple(make_requests(dict(admin_headers, **self.cache_reset_headers),
+                                            dict(user_headers, **self.cache_reset_headers)))
         number_duplicate_call_cached = 20
-        cache_requests = test_requests * number_duplicate_call_cached
+        cache_requests = make_requests(admin_headers, user_headers) * number_duplicate_call_cached
         random.shuffle(cache_requests)
 
-        # each method targets a different Permission, each path a different Resource, and each cookies a different user
-        token = get_constant("MAGPIE_COOKIE_NAME")
-        unique_calls = set((req.method, req.path_qs, req.cookies[token]) for _, req in test_requests + cache_requests)
+        # each method targets a different Permission, each path a different Resource, and each user a different ACL
+        unique_calls = {(req.method, req.path_qs, _user) for _, _user, req in test_requests}
 
         def run_check(test_requests_set, cached):
             _cached = " (cached)" if cached else ""
-            for i, (_allowed, _request) in enumerate(test_requests_set):
-                _cookie = _request.cookies[token]
-                _user = self.test_user_name if _cookie == user_cookies[token] else "admin"
+            for i, (_allowed, _user, _request) in enumerate(test_requests_set):
                 _msg = "Using ({}) [{}, {}]{} with user [{}]".format(
                     i, _request.method, _request.path_qs, _cached, _user
                 )
-                if not cached:
-                    _request.headers.update(no_cache_header)
-                else:
-                    _request.headers.pop("Cache-Control", None)
                 if _allowed:
                     utils.check_no_raise(lambda: self.ows.check_request(_request), msg=_msg)
                 else:
@@ -664,7 +677,7 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
 
         # obtain a reference to the 'service' that should be returned by 'service_factory' such that we can
         # prepare wrapped mock references to its '__acl__' and '_get_acl' methods
-        tmp_req = test_requests[0][1]
+        tmp_req = test_requests[0][2]
         service = self.ows.get_service(tmp_req)
         invalidate_service(self.test_service_name)
 
@@ -675,10 +688,12 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
             # all caches should remain active for the whole duration and not conflict with each other
             run_check(cache_requests, True)
 
-        # run cached requests tests
-        t_start = time.perf_counter()
-        mock_service_cached, mock_service, mock_acl_cached, mock_acl = self.run_with_caching_mocks(service, test_ops)
-        t_exec = time.perf_counter() - t_start
+        # run cached requests tests, avoiding garbage collection pauses interfering with their timing
+        with utils.disabled_garbage_collection():
+            t_start = time.perf_counter()
+            mocks = self.run_with_caching_mocks(service, test_ops)
+            t_exec = time.perf_counter() - t_start
+        mock_service_cached, mock_service, mock_acl_cached, mock_acl = mocks
 
         # validate performance
         #   average execution times for 'number_duplicate_call_cached = 20' and 8 requests in 'test_requests'
@@ -690,8 +705,8 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
         # there should be as many service resolution as there are requests, but only first ones without cache fetches it
         # for ACL resolution, there should also be as many as there are requests, but actual computation will be limited
         # to the number of combinations without caching, and all others only return the precomputed cache result
-        total_cached = len(cache_requests)
         total_no_cache = len(test_requests)
+        total_cached = total_no_cache * number_duplicate_call_cached
         total_calls = total_cached + total_no_cache
         # Because each request in 'test_requests' that targets the same 'service' with 'no-cache' header resets it,
         # and because each 'service' cache reset also invalidates *all* ACL caches that refer to that 'service', the
@@ -705,14 +720,19 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
         #      request resolved, those final cached ACL remains valid, while N-1 requests before must recalculate
         #      invalidated ACL once against on the first pass of non-'no-cache' header requests.)
         total_acl_cached = len(unique_calls) * 2 - 1
-        utils.check_val_equal(mock_service_cached.call_count, total_calls,
-                              msg="Cached service call expected for each request")
-        utils.check_val_equal(mock_acl_cached.call_count, total_calls,
-                              msg="Cached ACL resolution expected for each request")
-        utils.check_val_equal(mock_service.call_count, total_no_cache,
-                              msg="Real service call expected for each no-cache request, but not for other cached ones")
-        utils.check_val_equal(mock_acl.call_count, total_acl_cached,
-                              msg="Real ACL call expected only on first unique combination of cached ACL")
+        call_counts = {
+            "service_cached": mock_service_cached.call_count,
+            "acl_cached": mock_acl_cached.call_count,
+            "service_real": mock_service.call_count,
+            "acl_real": mock_acl.call_count,
+        }
+        expect_counts = {
+            "service_cached": total_calls,  # cached service call expected for each request
+            "acl_cached": total_calls,  # cached ACL resolution expected for each request
+            "service_real": total_no_cache,  # real service call expected for each no-cache request, not cached ones
+            "acl_real": total_acl_cached,  # real ACL call expected only on first unique combination of cached ACL
+        }
+        utils.check_val_equal(call_counts, expect_counts, msg="Unexpected cached/real call counts", diff=True)
 
     @utils.mocked_get_settings
     def test_cached_service_ows_parser_request(self):
@@ -758,7 +778,7 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
         svc_path_getcap = "/ows/proxy/{}?request=GetCapabilities&service=WPS".format(svc_name)  # allowed
         svc_path_desc = "/ows/proxy/{}?request=DescribeProcess&service=WPS".format(svc_name)  # denied
         svc_path_exec = "/ows/proxy/{}?request=Execute&service=WPS".format(svc_name)  # denied
-        test_requests = [
+        test_requests = (
             # First request should trigger caching of the service as 'Allowed' and corresponding ACL resolution.
             (True, self.mock_request(svc_path_getcap, method="GET")),
             # Following requests should reuse the cached service, not triggering another 'service_factory' operation.
@@ -768,19 +788,23 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
             # Test one of each Allowed/Denied resolution, to ensure the cached 'service' did not interfere with ACL
             (False, self.mock_request(svc_path_desc, method="GET")),
             (True, self.mock_request(svc_path_exec, method="GET")),
-        ]
+        )
         # Run multiple other requests afterwards to ensure that mix-and-match of above combinations still make use
         # of the cached service and cached ACL following first resolution of each case.
+        # messages are the same for duplicated requests, format them only once
+        test_requests = tuple(
+            (_allowed, _req, "Using [{}, {}] with user [{}]".format(_req.method, _req.path_qs, anonymous))
+            for _allowed, _req in test_requests
+        )
         number_duplicate_call_cached = 5
-        cache_requests = test_requests * number_duplicate_call_cached
+        cache_requests = list(test_requests) * number_duplicate_call_cached
         random.shuffle(cache_requests)
 
         # each method targets a different Permission (via query param 'request=<>')
-        unique_calls = set((req.method, req.path_qs) for _, req in test_requests + cache_requests)
+        unique_calls = {(req.method, req.path_qs) for _, req, _ in test_requests}
 
         def run_check(test_requests_set):
-            for _allowed, _request in test_requests_set:
-                _msg = "Using [{}, {}] with user [{}]".format(_request.method, _request.path_qs, anonymous)
+            for _allowed, _request, _msg in test_requests_set:
                 if _allowed:
                     utils.check_no_raise(lambda: self.ows.check_request(_request), msg=_msg)
                 else:
@@ -801,18 +825,23 @@ class TestAdapterCachingAllRegions(BaseTestAdapterCaching):
 
         # There should be as many service resolution as there are requests, but only first one without cache fetches it.
         # ACL resolution should also occur once for each 'request=<>' permission.
-        total_cached = len(cache_requests)
         total_no_cache = len(test_requests)
+        total_cached = total_no_cache * number_duplicate_call_cached
         total_calls = total_cached + total_no_cache
         total_acl_cached = len(unique_calls)
-        utils.check_val_equal(mock_service_cached.call_count, total_calls,
-                              msg="Cached service call expected for each request")
-        utils.check_val_equal(mock_acl_cached.call_count, total_calls,
-                              msg="Cached ACL resolution expected for each request")
-        utils.check_val_equal(mock_service.call_count, 1,
-                              msg="Real service call expected only for first call since it is always the same service")
-        utils.check_val_equal(mock_acl.call_count, total_acl_cached,
-                              msg="Real ACL expected only once per unique permission combination")
+        call_counts = {
+            "service_cached": mock_service_cached.call_count,
+            "acl_cached": mock_acl_cached.call_count,
+            "service_real": mock_service.call_count,
+            "acl_real": mock_acl.call_count,
+        }
+        expect_counts = {
+            "service_cached": total_calls,  # cached service call expected for each request
+            "acl_cached": total_calls,  # cached ACL resolution expected for each request
+            "service_real": 1,  # real service call expected only for first call since it is always the same service
+            "acl_real": total_acl_cached,  # real ACL expected only once per unique permission combination
+        }
+        utils.check_val_equal(call_counts, expect_counts, msg="Unexpected cached/real call counts", diff=True)
 
     @utils.mocked_get_settings
     def test_cached_service_invalidated_acl(self):
@@ -941,22 +970,26 @@ class TestAdapterCachingPartialRegions(BaseTestAdapterCaching):
         svc_path_getcap = "/ows/proxy/{}?request=GetCapabilities&service=WPS".format(svc_name)  # allowed
         svc_path_desc = "/ows/proxy/{}?request=DescribeProcess&service=WPS".format(svc_name)  # denied
         svc_path_exec = "/ows/proxy/{}?request=Execute&service=WPS".format(svc_name)  # denied
-        test_requests = [
+        test_requests = (
             # First request should trigger caching of the service, following use the cache
             # For each case, ACL should never be cached.
             (True, self.mock_request(svc_path_getcap, method="GET")),
             (False, self.mock_request(svc_path_desc, method="GET")),
             (False, self.mock_request(svc_path_exec, method="GET")),
-        ]
+        )
         # Run multiple other requests afterwards to ensure that mix-and-match of above combinations still make use
         # of the cached service and cached ACL following first resolution of each case.
+        # messages are the same for duplicated requests, format them only once
+        test_requests = tuple(
+            (_allowed, _req, "Using [{}, {}] with user [{}]".format(_req.method, _req.path_qs, anonymous))
+            for _allowed, _req in test_requests
+        )
         number_duplicate_call_cached = 5
-        cache_requests = test_requests * number_duplicate_call_cached
+        cache_requests = list(test_requests) * number_duplicate_call_cached
         random.shuffle(cache_requests)
 
         def run_check(test_requests_set):
-            for _allowed, _request in test_requests_set:
-                _msg = "Using [{}, {}] with user [{}]".format(_request.method, _request.path_qs, anonymous)
+            for _allowed, _request, _msg in test_requests_set:
                 if _allowed:
                     utils.check_no_raise(lambda: self.ows.check_request(_request), msg=_msg)
                 else:
@@ -977,14 +1010,59 @@ class TestAdapterCachingPartialRegions(BaseTestAdapterCaching):
 
         # There should be as many service resolution as there are requests, but only first one without cache fetches it.
         # ACL resolution should also occur once for each 'request=<>' permission.
-        total_cached = len(cache_requests)
         total_no_cache = len(test_requests)
+        total_cached = total_no_cache * number_duplicate_call_cached
         total_calls = total_cached + total_no_cache
-        utils.check_val_equal(mock_service_cached.call_count, total_calls,
-                              msg="Cached service call expected for each request")
-        utils.check_val_equal(mock_acl_cached.call_count, total_calls,
-                              msg="Cached ACL resolution expected for each request")
-        utils.check_val_equal(mock_service.call_count, 1,
-                              msg="Real service call expected only for first call since it is always the same service")
-        utils.check_val_equal(mock_acl.call_count, total_calls,
-                              msg="Real ACL call expected every time (cache disabled in ACL region setting)")
+        call_counts = {
+            "service_cached": mock_service_cached.call_count,
+            "acl_cached": mock_acl_cached.call_count,
+            "service_real": mock_service.call_count,
+            "acl_real": mock_acl.call_count,
+        }
+        expect_counts = {
+            "service_cached": total_calls,  # cached service call expected for each request
+            "acl_cached": total_calls,  # cached ACL resolution expected for each request
+            "service_real": 1,  # real service call expected only for first call since it is always the same service
+            "acl_real": total_calls,  # real ACL call expected every time (cache disabled in ACL region setting)
+        }
+        utils.check_val_equal(call_counts, expect_counts, msg="Unexpected cached/real call counts", diff=True)
+
+
+@unittest.skipIf(six.PY2, "Unsupported Twitcher for MagpieAdapter in Python 2")
+@pytest.mark.skipif(six.PY2, reason="Unsupported Twitcher for MagpieAdapter in Python 2")
+@runner.MAGPIE_TEST_ADAPTER
+@runner.MAGPIE_TEST_LOGIN
+@runner.MAGPIE_TEST_UTILS
+def test_verify_session_does_not_persist_cookies():
+    """
+    Validate that the session shared by :func:`magpie.adapter.verify_user` calls doesn't carry cookies between them.
+
+    Otherwise, the authentication cookie returned by the sign-in of one user would be sent along the following ones.
+    """
+    signin_url = "http://localhost:2001/magpie/signin"
+    session = get_verify_session()
+    sent_cookies = []
+
+    adapter = session.get_adapter(signin_url)
+
+    def mock_send(request, **__):
+        # only the connection is mocked, the response (and its cookies) is built from raw headers as usual
+        sent_cookies.append(request.headers.get("Cookie"))
+        raw = mock.MagicMock()
+        raw.status = 200
+        raw.reason = "OK"
+        raw.headers = {"Content-Type": CONTENT_TYPE_JSON}
+        raw._original_response.msg.get_all.return_value = [  # pylint: disable=W0212
+            "auth_tkt=user-{}; Path=/".format(len(sent_cookies))
+        ]
+        resp = adapter.build_response(request, raw)
+        resp._content = b"{}"  # pylint: disable=W0212
+        return resp
+
+    with mock.patch.object(adapter, "send", side_effect=mock_send):
+        resp1 = session.get(signin_url)
+        resp2 = session.get(signin_url)
+    utils.check_val_equal(sent_cookies, [None, None], msg="No cookie should be sent by any sign-in request.")
+    utils.check_val_equal(len(session.cookies), 0, msg="Session should not persist any cookie.")
+    utils.check_val_equal(resp1.cookies.get("auth_tkt"), "user-1")
+    utils.check_val_equal(resp2.cookies.get("auth_tkt"), "user-2")
@@ -156,20 +156,21 @@ class TestCase_MagpieUI_AdminAuth_Local(ti.Interface_MagpieUI_AdminAuth, unittes
             }
             resp = utils.TestSetup.check_FormSubmit(self, form_match="add_resource_form", form_submit="add_child",
                                                     form_data=data, previous_response=resp)
-            for res_name in (self.test_service_parent_resource_name, self.test_service_child_resource_name):
-                if TestVersion(self.version) <= TestVersion("3.20.1"):
-                    if TestVersion(self.version) >= TestVersion("3.0"):
-                        find = "<div class=\"tree-key\">{}</div>".format(res_name)
-                        text = resp.text.replace("\n", "").replace("  ", "")  # ignore formatting of source file
-                    else:
-                        find = "<div class=\"tree-item\">{}</div>".format(res_name)
-                        text = resp.text
+            # resolve the rendered tree format and normalized page contents once for all resources to look for
+            if TestVersion(self.version) <= TestVersion("3.20.1"):
+                if TestVersion(self.version) >= TestVersion("3.0"):
+                    find = "<div class=\"tree-key\">{}</div>"
+                    text = resp.text.replace("\n", "").replace("  ", "")  # ignore formatting of source file
                 else:
-                    # ignore other CSS classes (eg: tooltip) applied in front,
-                    # target specifically the value rather than any container to adjust rendering the tree-key
-                    find = "tree-key-value\">{}</".format(res_name)
+                    find = "<div class=\"tree-item\">{}</div>"
                     text = resp.text
-                utils.check_val_is_in(find, text, msg=utils.null)
+            else:
+                # ignore other CSS classes (eg: tooltip) applied in front,
+                # target specifically the value rather than any container to adjust rendering the tree-key
+                find = "tree-key-value\">{}</"
+                text = resp.text
+            for res_name in (self.test_service_parent_resource_name, self.test_service_child_resource_name):
+                utils.check_val_is_in(find.format(res_name), text, msg=utils.null)
         finally:
             utils.TestSetup.delete_TestService(self, override_service_name=self.test_service_parent_resource_name)
 
@@ -1,3 +1,8 @@
+import sqlalchemy as sa
+from pyramid.testing import DummyRequest
+
+from magpie import models
+from magpie.db import get_session_factory
 from magpie.models import UserStatuses
 from tests import runner
 
@@ -67,3 +72,37 @@ def test_user_status_combinations():
         assert test_statuses[idx] is status  # iterated value is also an enum member, not plain int
     assert idx == 0
     assert merge_status.value == UserStatuses.Pending.value
+
+
+@runner.MAGPIE_TEST_UTILS
+def test_request_group_not_reused_across_requests():
+    """
+    Groups memoized by :func:`get_request_group` must not leak into following requests.
+
+    The thread-local database session is the same for consecutive requests. A group renamed by another session between
+    them must therefore not be returned by the following request under its old name.
+    """
+    engine = sa.create_engine("sqlite://")
+    models.Group.__table__.create(engine)
+    session_factory = get_session_factory(engine)
+    other_session = get_session_factory(engine)()
+    other_session.add(models.Group(group_name="foo"))
+    other_session.commit()
+
+    request = DummyRequest()
+    request.db = session_factory()
+    group = models.get_request_group("foo", request)
+    assert group is not None
+    assert models.get_request_group("foo", request) is group  # memoized within the same request
+    request.db.commit()
+
+    other_session.query(models.Group).filter(models.Group.group_name == "foo").update({"group_name": "bar"})
+    other_session.commit()
+
+    request = DummyRequest()
+    request.db = session_factory()
+    assert request.db is sa.inspect(group).session  # same thread-local session reused by the next request
+    assert models.get_request_group("foo", request) is None
+    assert models.get_request_group("bar", request).group_name == "bar"
+    session_factory.remove()
+    other_session.close()
@@ -123,6 +123,27 @@ class TestPermissions(ti.ConfigTestCase, unittest.TestCase):
         utils.check_all_equal(format_perms["permission_names"], expect_names, any_order=False)
         utils.check_all_equal(format_perms["permissions"], expect_perms, any_order=False)
 
+    def test_format_permissions_allowed_unmodified(self):
+        """
+        Validate that modifying formatted allowed permissions does not affect following results for the same names.
+
+        .. seealso::
+            :meth:`test_format_permissions_allowed`
+        """
+        test_perms = [Permission.READ, Permission.WRITE]
+        format_perms = format_permissions(test_perms, PermissionType.ALLOWED)
+        expect_perms = format_perms["permissions"]
+        expect_names = list(format_perms["permission_names"])
+        format_perms["permissions"] = [dict(perm) for perm in expect_perms]
+        for perm in expect_perms:
+            perm["type"] = PermissionType.APPLIED.value
+        expect_perms.clear()
+        format_perms["permission_names"].append("other")
+
+        format_perms_again = format_permissions(test_perms, PermissionType.ALLOWED)
+        utils.check_all_equal(format_perms_again["permission_names"], expect_names, any_order=False)
+        utils.check_all_equal(format_perms_again["permissions"], format_perms["permissions"], any_order=False)
+
     def test_permission_compare_invalid(self):
         """
         Check that invalid comparison classes does not raise an error.
@@ -1590,3 +1590,25 @@ class TestServicesCachedSessionReconnect(ti.UserTestCase, ti.BaseTestCase):
             perms = [perm for perm in perms if perm.name == Permission.READ]
             utils.check_val_equal(len(perms), 1)
             utils.check_all_equal(perms[0].json(), self.test_res_perm.json())
+
+
+@runner.MAGPIE_TEST_SERVICES
+@runner.MAGPIE_TEST_PERMISSIONS
+@runner.MAGPIE_TEST_UTILS
+def test_service_geoserver_combined_definitions_immutable():
+    """
+    Validate that memoized definitions combined from services supported by :class:`ServiceGeoserver` cannot be modified.
+
+    Since they are shared by all callers, any modification would otherwise corrupt them for the whole process.
+    """
+    perms = ServiceGeoserver.permissions
+    params = ServiceGeoserver.params_expected
+    res_perms = ServiceGeoserver.resource_types_permissions
+    utils.check_val_is_in(Permission.GET_CAPABILITIES, perms)
+    utils.check_raises(lambda: perms.append(Permission.READ), AttributeError)
+    utils.check_raises(lambda: params.append("test"), AttributeError)
+    utils.check_raises(lambda: res_perms.update({models.Directory: [Permission.READ]}), AttributeError)
+    for perms_list in res_perms.values():
+        utils.check_raises(lambda _perms=perms_list: _perms.append(Permission.READ), AttributeError)
+    utils.check_val_equal(ServiceGeoserver.permissions, perms)
+    utils.check_val_not_in(models.Directory, ServiceGeoserver.resource_types_permissions)
@@ -10,11 +10,15 @@ Tests for the various utility operations employed by Magpie.
 import inspect
 import os
 import re
+import smtplib
 import tempfile
+import threading
 import unittest
 
 import mock
+import pytest
 import six
+from pyramid.authentication import AuthTktCookieHelper
 from pyramid.httpexceptions import HTTPBadRequest, HTTPForbidden, HTTPInternalServerError, HTTPOk
 from pyramid.settings import asbool
 
@@ -23,7 +27,15 @@ from magpie.api import exception as ax
 from magpie.api import generic as ag
 from magpie.api import requests as ar
 from magpie.compat import LooseVersion
-from magpie.utils import CONTENT_TYPE_JSON, ExtendedEnum, get_header, get_magpie_url, import_target
+from magpie.utils import (
+    CONTENT_TYPE_JSON,
+    ExtendedEnum,
+    debug_cookie_identify,
+    get_header,
+    get_magpie_url,
+    import_target,
+    parse_version_numbers
+)
 from tests import runner, utils
 
 if six.PY2:
@@ -81,6 +93,19 @@ def test_import_target():
             assert func is None
 
 
+@runner.MAGPIE_TEST_UTILS
+@pytest.mark.parametrize("version, expected", [
+    ("0.6.0", (0, 6, 0)),
+    ("0.10.2", (0, 10, 2)),
+    ("1.2", (1, 2, 0)),
+    ("0.9.0rc1", (0, 9, 0)),
+    ("1.2.3.4", (1, 2, 3)),
+    ("dev", (0, 0, 0)),
+])
+def test_parse_version_numbers(version, expected):
+    assert parse_version_numbers(version) == expected
+
+
 @runner.MAGPIE_TEST_LOCAL
 @runner.MAGPIE_TEST_UTILS
 class TestUtils(unittest.TestCase):
@@ -236,6 +261,26 @@ class TestUtils(unittest.TestCase):
         ax.verify_param("abc", matches=True, param_compare=r"[a-z]+")
         ax.verify_param("abc", matches=True, param_compare=re.compile(r"[a-z]+"))
 
+    def test_verify_param_content_callable(self):
+        """
+        Validate that content provided as function is only generated when the verification fails.
+        """
+        calls = []
+
+        def get_content():
+            calls.append(True)
+            return {"extra": "value"}
+
+        ax.verify_param("x", not_empty=True, content=get_content)
+        ax.evaluate_call(lambda: int("1"), content=get_content)
+        utils.check_val_equal(len(calls), 0, msg="content should not be generated when verification passes")
+        exc = utils.check_raises(lambda: ax.verify_param("", not_empty=True, content=get_content), HTTPBadRequest)
+        utils.check_val_equal(exc.json["extra"], "value")
+        exc = utils.check_raises(lambda: ax.evaluate_call(lambda: int("x"), content=get_content),
+                                 HTTPInternalServerError)
+        utils.check_val_equal(exc.json["call"]["content"], repr({"extra": "value"}))
+        utils.check_val_equal(len(calls), 2)
+
     def test_verify_param_args_incorrect_usage(self):
         """
         Invalid usage of function raises internal server error instead of 'normal HTTP error'.
@@ -385,6 +430,33 @@ class TestUtils(unittest.TestCase):
         # if it did not get called at least more than once, use cases did not really get tested
         utils.check_val_is_in(mock_calls["counter"], list(range(2, ax.RAISE_RECURSIVE_SAFEGUARD_MAX + 1)))  # noqa
 
+    def test_raise_http_recursive_safeguard_per_thread(self):
+        """
+        Validate that the recursion counter of another thread does not affect errors raised by the current thread.
+        """
+        def exhaust_safeguard():
+            ax.RAISE_RECURSIVE_SAFEGUARD_STATE.count = ax.RAISE_RECURSIVE_SAFEGUARD_MAX
+
+        thread = threading.Thread(target=exhaust_safeguard)
+        thread.start()
+        thread.join()
+        resp = ax.raise_http(HTTPForbidden, detail="test", nothrow=True)
+        utils.check_val_type(resp, HTTPForbidden)
+        utils.check_val_equal(resp.json["detail"], "test")
+
+    def test_validate_params_memoized_validation(self):
+        """
+        Validate that memoized validations of HTTP parameters do not bypass verification of other combinations.
+        """
+        result = ax.validate_params(HTTPForbidden, [HTTPForbidden], "test", None, CONTENT_TYPE_JSON)
+        utils.check_val_equal(result, (HTTPForbidden.code, "test", {}))
+        result = ax.validate_params(HTTPForbidden, [HTTPForbidden], "test", None, CONTENT_TYPE_JSON)
+        utils.check_val_equal(result, (HTTPForbidden.code, "test", {}))
+        utils.check_raises(lambda: ax.validate_params(HTTPForbidden, [HTTPForbidden], "test", None, "invalid/type"),
+                           HTTPInternalServerError, msg="invalid content type should raise even if class was validated")
+        utils.check_raises(lambda: ax.validate_params(HTTPForbidden, [HTTPOk], "test", None, CONTENT_TYPE_JSON),
+                           HTTPInternalServerError, msg="invalid base class should raise even if class was validated")
+
     def test_format_content_json_str_invalid_usage(self):
         non_json_serializable_content = {"key": HTTPInternalServerError()}
         utils.check_raises(
@@ -404,6 +476,69 @@ class TestUtils(unittest.TestCase):
         utils.check_val_equal(content_type, CONTENT_TYPE_JSON)
         utils.check_val_equal(where, True)
 
+    def test_debug_cookie_identify_invalid_ticket(self):
+        cookie_helper = AuthTktCookieHelper("secret", cookie_name="auth_tkt", hashalg="sha512")
+        request = utils.mock_request()
+        request.cookies = {"auth_tkt": "not-a-valid-ticket"}
+        with mock.patch.object(request, "_get_authentication_policy", create=True,
+                               return_value=mock.Mock(cookie=cookie_helper)), \
+                mock.patch("magpie.utils.LOGGER.isEnabledFor", return_value=True):
+            utils.check_no_raise(lambda: debug_cookie_identify(request),
+                                 msg="invalid cookie ticket should only be logged, not raised")
+
+    def test_get_email_template_cached_until_modified(self):
+        """
+        Validate that email templates are compiled only once, unless their file was modified since.
+        """
+        from magpie.api.notifications import get_email_template  # pylint: disable=C0415
+
+        tmpl_const = "MAGPIE_USER_REGISTRATION_NOTIFY_EMAIL_TEMPLATE"
+        with tempfile2.TemporaryDirectory() as tmp_dir:
+            tmpl_path = os.path.join(tmp_dir, "email.mako")
+            with open(tmpl_path, mode="w", encoding="utf-8") as tmpl_file:
+                tmpl_file.write("first")
+            settings = {"magpie.user_registration_notify_email_template": tmpl_path}
+            template = get_email_template(tmpl_const, settings)
+            utils.check_val_true(get_email_template(tmpl_const, settings) is template, msg="template should be reused")
+
+            with open(tmpl_path, mode="w", encoding="utf-8") as tmpl_file:
+                tmpl_file.write("second")
+            mtime = os.path.getmtime(tmpl_path) + 10  # ensure distinct time regardless of file system resolution
+            os.utime(tmpl_path, (mtime, mtime))
+            updated = get_email_template(tmpl_const, settings)
+            utils.check_val_false(updated is template, msg="modified template should be reloaded")
+            utils.check_val_equal(updated.render().strip(), "second")
+
+    def test_send_email_reuses_smtp_connection(self):
+        """
+        Validate that consecutive emails reuse the same SMTP connection while the server still responds to it.
+        """
+        from magpie.api import notifications  # pylint: disable=C0415
+
+        with tempfile2.TemporaryDirectory() as tmp_dir:
+            tmpl_path = os.path.join(tmp_dir, "email.mako")
+            with open(tmpl_path, mode="w", encoding="utf-8") as tmpl_file:
+                tmpl_file.write("test")
+            settings = {"magpie.smtp_host": "example.com", "magpie.smtp_from": "magpie@example.com",
+                        "magpie.smtp_password": "", "magpie.url": "http://localhost",
+                        "magpie.user_registration_notify_email_template": tmpl_path}
+            template = notifications.get_email_template("MAGPIE_USER_REGISTRATION_NOTIFY_EMAIL_TEMPLATE", settings)
+            server = mock.MagicMock()
+            server.noop.return_value = (250, b"OK")
+            server.sendmail.return_value = {}
+            try:
+                with mock.patch("magpie.api.notifications.get_smtp_server_connection", return_value=server) as conn:
+                    utils.check_val_true(notifications.send_email("a@example.com", settings, template))
+                    utils.check_val_true(notifications.send_email("b@example.com", settings, template))
+                    utils.check_val_equal(conn.call_count, 1, msg="connection should be reused")
+                    utils.check_val_equal(server.sendmail.call_count, 2)
+
+                    server.noop.side_effect = smtplib.SMTPServerDisconnected
+                    utils.check_val_true(notifications.send_email("c@example.com", settings, template))
+                    utils.check_val_equal(conn.call_count, 2, msg="expired connection should be replaced")
+            finally:
+                notifications.close_smtp_server_connection()
+
     def test_get_magpie_url_defined_or_defaults(self):
         # Disable constants globals() for every case, since it can pre-loaded from .env when running all tests.
         # Always need to provide a settings container (even empty direct when nothing define in settings),
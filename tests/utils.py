@@ -1,6 +1,7 @@
 import contextlib
 import difflib
 import functools
+import gc
 import importlib
 import inspect
 import itertools
@@ -52,7 +53,7 @@ from magpie.utils import (
 
 if TYPE_CHECKING:
     # pylint: disable=W0611,unused-import
-    from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple, Type, Union
+    from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
     from pyramid.request import Request
     from pyramid.router import Router
@@ -363,6 +364,9 @@ def get_test_twitcher_app(settings=None):
     return test_app
 
 
+# versions of remote servers already retrieved by test cases (see 'TestSetup.get_Version')
+TEST_REMOTE_VERSIONS = {}
+
 # shared handles to monkey-patch caches over test cases
 TEST_CACHE_HANDLES = {}
 TEST_CACHE_REGIONS_FUNCTIONS = {
@@ -913,6 +917,23 @@ def mock_send_email(target):
 __WRAPPED_INSTANCES__ = {}
 
 
+@contextlib.contextmanager
+def disabled_garbage_collection():
+    # type: () -> Iterator[None]
+    """
+    Context that disables the garbage collector to avoid collection pauses within timed operations.
+
+    The garbage collector is enabled again when leaving the context, only if it was enabled before entering it.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 def wrapped_call(target, method=None, instance=None, side_effect=None):
     # type: (Union[Type, Str], Optional[Str], Optional[Any], Callable[[...], Any]) -> mock.MagicMock
     """
@@ -1930,11 +1951,20 @@ class TestSetup(object):
             if version:
                 return version
         app_or_url = get_app_or_url(test_case)
+        # remote server version cannot change during the test run, avoid repeating the request for every test suite
+        cache_version = (
+            isinstance(app_or_url, six.string_types) and override_headers is null and override_cookies is null
+        )
+        if cache_version and app_or_url in TEST_REMOTE_VERSIONS:
+            return TEST_REMOTE_VERSIONS[app_or_url]
         resp = test_request(app_or_url, "GET", "/version",
                             headers=override_headers if override_headers is not null else test_case.json_headers,
                             cookies=override_cookies if override_cookies is not null else test_case.cookies)
         json_body = check_response_basic_info(resp, 200)
-        return json_body["version"]
+        version = json_body["version"]
+        if cache_version:
+            TEST_REMOTE_VERSIONS[app_or_url] = version
+        return version
 
     @staticmethod
     def check_UpStatus(test_case,               # type: TestAppOrUrlType
@@ -2438,8 +2468,9 @@ class TestSetup(object):
                                                        override_headers=override_headers,
                                                        override_cookies=override_cookies)
         else:
+            # permission names are only needed to pick the default permission, avoid the extra request otherwise
             no_perms = "permission_names" not in resource_info or not resource_info.get("permission_names")
-            get_details = no_perms or override_permission is null
+            get_details = no_perms and override_permission is null
             resource_info = TestSetup.get_ResourceInfo(test_case, override_body=resource_info, full_detail=get_details,
                                                        override_headers=override_headers,
                                                        override_cookies=override_cookies)